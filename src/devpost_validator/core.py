@@ -324,7 +324,7 @@ class DevPostValidator:
             if features.analyze_technology_stack:
                 result.technology_analysis_results = self.technology_analyzer.analyze_repo(temp_dir)
 
-            rule_violations = []
+            text_files = []
             for root, _, files in os.walk(temp_dir):
                 if ".git" in root:
                     continue
@@ -332,21 +332,16 @@ class DevPostValidator:
                 for file in files:
                     file_path = os.path.join(root, file)
 
-                    if self._is_binary_file(file_path):
-                        continue
-
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-
-                            violations = self.rule_engine.check_content(content)
-                            if violations:
-                                rel_path = os.path.relpath(file_path, temp_dir)
-                                for v in violations:
-                                    v["file"] = rel_path
-                                rule_violations.extend(violations)
-                    except Exception:
-                        pass
+                    if not self._is_binary_file(file_path):
+                        text_files.append(file_path)
+
+            rule_violations = []
+            for file_path, violations in self.rule_engine.check_files_streaming(text_files):
+                if violations:
+                    rel_path = os.path.relpath(file_path, temp_dir)
+                    for v in violations:
+                        v["file"] = rel_path
+                    rule_violations.extend(violations)
 
             result.rule_violations = rule_violations
 
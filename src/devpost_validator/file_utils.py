@@ -0,0 +1,78 @@
+"""
+File helpers shared by the repository scanners in DevPost Validator.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_repo_files(repo_path: str, prune: Callable[[os.DirEntry], bool]) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Yield (entry, rel_path) for every file in a repository, in os.walk order.
+
+    Symlinked directories and directories for which ``prune`` returns True are
+    not descended into. Each DirEntry keeps the file type from the directory
+    listing and caches its stat.
+
+    Args:
+        repo_path: Path to the repository root
+        prune: Called with the DirEntry of each subdirectory
+
+    Yields:
+        (entry, rel_path) pairs, rel_path being relative to repo_path
+    """
+    pending = [(repo_path, "")]
+
+    while pending:
+        dir_path, rel_dir = pending.pop()
+        subdirs = []
+
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if not is_dir:
+                        yield entry, rel_path
+                    elif not entry.is_symlink() and not prune(entry):
+                        subdirs.append((entry.path, rel_path))
+        except OSError:
+            continue
+
+        pending.extend(reversed(subdirs))
+
+
+def read_ahead(items: Iterable[T], read: Callable[[T], Any], io_workers: int = 4,
+               max_pending: int = 32) -> Iterator[Tuple[T, Future]]:
+    """
+    Run ``read`` for each item on a thread pool, keeping up to ``max_pending`` reads ahead of the caller.
+
+    Reads release the GIL, so disk I/O overlaps with the work the caller does
+    between items. Items are only pulled from ``items`` as reads are submitted.
+
+    Args:
+        items: Items to read
+        read: Called with each item on a pool thread
+        io_workers: Number of threads reading
+        max_pending: Maximum number of reads submitted but not yet yielded
+
+    Yields:
+        (item, future of read(item)) pairs in the order of ``items``
+    """
+    with ThreadPoolExecutor(max_workers=io_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append((item, executor.submit(read, item)))
+            if len(pending) >= max_pending:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
@@ -0,0 +1,43 @@
+"""
+JSON helpers for DevPost Validator's on-disk data.
+
+orjson is used when it is installed and the standard library otherwise.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: Encoded JSON as bytes or str
+    
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: The object to serialize
+        indent: Pretty-print with a two-space indent
+    
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, ClassVar, Type
 
 
 class PluginBase:
@@ -8,6 +8,14 @@ class PluginBase:
     All plugins should inherit from this class and implement
     the required methods.
     """
+
+    # Every subclass, in definition order; the rule engine reads the classes
+    # defined while a plugin module executes instead of scanning the module.
+    _registry: ClassVar[List[Type["PluginBase"]]] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        PluginBase._registry.append(cls)
     
     def __init__(self, name: str):
         """
@@ -1,15 +1,235 @@
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Type, FrozenSet, Iterable, Iterator, Tuple, Pattern, TYPE_CHECKING
 import re
-import importlib.util
 import sys
 from pathlib import Path
-import json
 import os
-import importlib
-import inspect
-from typing import List, Dict, Any, Optional, Type, Union
+from functools import lru_cache
+from concurrent.futures import Future
+from types import MappingProxyType
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from . import json_utils
+from .file_utils import read_ahead
+from .text_utils import IGNORECASE_ASCII_FOLDS, line_number, newline_offsets
+
+if TYPE_CHECKING:
+    from .plugin_base import PluginBase
+
+
+# ASCII letter -> the non-ASCII characters case-insensitive matching folds onto it
+_CASE_FOLD_EXTRAS: Dict[str, str] = {}
+for _char, _letter in IGNORECASE_ASCII_FOLDS.items():
+    _CASE_FOLD_EXTRAS[_letter] = _CASE_FOLD_EXTRAS.get(_letter, "") + _char
+del _char, _letter
+
+# Widest character range expanded when deriving required characters.
+_MAX_REQUIRED_RANGE = 128
+
+
+# Built-in rules, shared read-only by every RuleEngine.
+_DEFAULT_RULES = (
+    MappingProxyType({
+        "name": "hardcoded_credentials",
+        "pattern": r"(?:password|passwd|pwd|secret|token|api[_-]?key)(?:\s*=\s*[\"\']((?!\{\{)[^\"\']){5,}[\"\'])",
+        "description": "Hardcoded credentials detected",
+        "severity": "high"
+    }),
+    MappingProxyType({
+        "name": "debug_statement",
+        "pattern": r"(?:console\.log|print|println|System\.out\.print|debugger|var_dump|dd\()",
+        "description": "Debug statement detected",
+        "severity": "low"
+    }),
+    MappingProxyType({
+        "name": "todo_comment",
+        "pattern": r"(?://|#|<!--|/\*)\s*TODO:",
+        "description": "TODO comment detected",
+        "severity": "low"
+    }),
+    MappingProxyType({
+        "name": "fixme_comment",
+        "pattern": r"(?://|#|<!--|/\*)\s*FIXME:",
+        "description": "FIXME comment detected",
+        "severity": "medium"
+    }),
+    MappingProxyType({
+        "name": "commented_code",
+        "pattern": r"(?://|#|<!--|/\*)\s*(?:function|def|class|if|for|while)\b",
+        "description": "Commented out code detected",
+        "severity": "low"
+    }),
+    MappingProxyType({
+        "name": "exception_swallowing",
+        "pattern": r"(?:try\s*{[^}]*}\s*catch\s*\([^)]*\)\s*{[^}]*}|try:[^\n]*\n\s*except(?:\s+\w+)?:[^\n]*\n\s*pass\b)",
+        "description": "Exception swallowing detected",
+        "severity": "medium"
+    }),
+    MappingProxyType({
+        "name": "magic_number",
+        # Starts with the digit class so re can skip ahead to candidate positions;
+        # the lookbehind then rejects digits that follow a word character.
+        "pattern": r"[0-9](?<!\w[0-9])(?:[0-9]{3,}|(?<=0)x[0-9a-fA-F]{3,})(?!\w)",
+        "description": "Magic number detected",
+        "severity": "low"
+    }),
+    MappingProxyType({
+        "name": "nested_loop",
+        "pattern": r"(?:for\s*\([^)]*\)\s*{[^{]*for\s*\([^)]*\)|for\s+\w+\s+in\s+[^:]+:\s*\n\s+for\s+\w+\s+in\s+)",
+        "description": "Nested loop detected",
+        "severity": "low"
+    }),
+    MappingProxyType({
+        "name": "sql_injection",
+        "pattern": r"(?:\"SELECT\s+.*\"\s*\+\s*|'SELECT\s+.*'\s*\+\s*|\"INSERT\s+INTO\s+.*\"\s*\+\s*|'INSERT\s+INTO\s+.*'\s*\+\s*)",
+        "description": "Potential SQL injection risk",
+        "severity": "high"
+    }),
+    MappingProxyType({
+        "name": "shell_injection",
+        "pattern": r"(?:os\.system\(.*\+|subprocess\.call\(.*\+|exec\(.*\+|eval\(.*\+)",
+        "description": "Potential shell injection risk",
+        "severity": "high"
+    }),
+    MappingProxyType({
+        "name": "unhandled_error",
+        "pattern": r"throw\s+new\s+Error\((?!\".*notImplemented)",
+        "description": "Unhandled error detected",
+        "severity": "medium"
+    }),
+    MappingProxyType({
+        "name": "copilot_marker",
+        "pattern": r"(?:Copilot|GitHub Copilot|@ai\/suggestion|@copilot\/suggestion)",
+        "description": "GitHub Copilot marker detected",
+        "severity": "high"
+    }),
+    MappingProxyType({
+        "name": "chatgpt_marker",
+        "pattern": r"(?:ChatGPT|GPT-3|GPT-4|OpenAI|gpt\.|GPT\.|Model:\s*GPT)",
+        "description": "ChatGPT marker detected",
+        "severity": "high"
+    }),
+    MappingProxyType({
+        "name": "unnecessary_comment",
+        "pattern": r"(?://|#)\s*(?:This function|This method|This class)\s+(?:is|does|implements|handles)",
+        "description": "Unnecessary explanatory comment",
+        "severity": "low"
+    }),
+    MappingProxyType({
+        "name": "default_export",
+        "pattern": r"export\s+default\s+(?:function|class|const|let|var)",
+        "description": "Default export detected (could indicate boilerplate)",
+        "severity": "low"
+    }),
+)
+
+
+def _approx_min_len(pattern: str) -> int:
+    """Return a lower bound on the length of any match of ``pattern``."""
+    try:
+        return sre_parse.parse(pattern).getwidth()[0]
+    except Exception:
+        return 0
+
+
+def _required_chars(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Return a set of characters at least one of which appears in every match
+    of ``pattern``, or None if no such set can be derived.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    return _sequence_required_chars(parsed, bool(parsed.state.flags & re.IGNORECASE))
+
+
+def _fold_chars(chars: FrozenSet[str], ignore_case: bool) -> Optional[FrozenSet[str]]:
+    if not ignore_case:
+        return chars
+    folded = set()
+    for c in chars:
+        # Case folding of non-ASCII characters, such as U+00DF and U+1E9E, is not tracked
+        if not c.isascii():
+            return None
+        folded.update((c, c.lower(), c.upper()))
+        folded.update(_CASE_FOLD_EXTRAS.get(c.lower(), ""))
+    return frozenset(folded)
+
+
+def _sequence_required_chars(items, ignore_case: bool) -> Optional[FrozenSet[str]]:
+    best = None
+    for op, av in items:
+        chars = _item_required_chars(op, av, ignore_case)
+        if chars is not None and (best is None or len(chars) < len(best)):
+            best = chars
+    return best
+
+
+def _item_required_chars(op, av, ignore_case: bool) -> Optional[FrozenSet[str]]:
+    if op is sre_parse.LITERAL:
+        return _fold_chars(frozenset(chr(av)), ignore_case)
+
+    if op is sre_parse.IN:
+        chars = set()
+        for item_op, item_av in av:
+            if item_op is sre_parse.LITERAL:
+                chars.add(chr(item_av))
+            elif item_op is sre_parse.RANGE and item_av[1] - item_av[0] < _MAX_REQUIRED_RANGE:
+                chars.update(chr(c) for c in range(item_av[0], item_av[1] + 1))
+            else:
+                return None
+        return _fold_chars(frozenset(chars), ignore_case)
+
+    if op is sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, sub = av
+        sub_ignore_case = (ignore_case or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+        return _sequence_required_chars(sub, sub_ignore_case)
+
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None)):
+        min_count, _, sub = av
+        return _sequence_required_chars(sub, ignore_case) if min_count > 0 else None
+
+    if op is getattr(sre_parse, "ATOMIC_GROUP", None):
+        return _sequence_required_chars(av, ignore_case)
+
+    if op is sre_parse.BRANCH:
+        chars = set()
+        for alternative in av[1]:
+            alternative_chars = _sequence_required_chars(alternative, ignore_case)
+            if alternative_chars is None:
+                return None
+            chars.update(alternative_chars)
+        return frozenset(chars)
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> Optional[Tuple[Pattern[str], int, Optional[FrozenSet[str]]]]:
+    """
+    Compile ``pattern`` together with its minimum match length and required
+    characters, or return None if it is not a valid regex. Results are shared
+    by every RuleEngine in the process.
+    """
+    try:
+        regex = re.compile(pattern, re.MULTILINE)
+    except re.error:
+        return None
+    return regex, _approx_min_len(pattern), _required_chars(pattern)
+
+
+for _rule in _DEFAULT_RULES:
+    _compile_pattern(_rule["pattern"])
+del _rule
+
 
-from .plugin_base import PluginBase
+def _read_text(file_path: str) -> str:
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
 
 
 class RuleEngine:
@@ -18,111 +238,22 @@ class RuleEngine:
         self.custom_rules = []
         self.plugins = []
         self.plugin_instances = []
+        self._compiled_rules = []
+        self._min_match_len = 0
+        self._required_chars: Optional[FrozenSet[str]] = None
+        self._suppress_save = False
+        self._pending_rules: List[Dict[str, Any]] = []
         self.rule_dir = Path.home() / ".devpost-validator" / "rules"
         self.rule_dir.mkdir(exist_ok=True, parents=True)
         self._load_rules()
 
     def _load_rules(self) -> None:
-        default_rules = [
-            {
-                "name": "hardcoded_credentials",
-                "pattern": r"(?:password|passwd|pwd|secret|token|api[_-]?key)(?:\s*=\s*[\"\']((?!\{\{)[^\"\']){5,}[\"\'])",
-                "description": "Hardcoded credentials detected",
-                "severity": "high"
-            },
-            {
-                "name": "debug_statement",
-                "pattern": r"(?:console\.log|print|println|System\.out\.print|debugger|var_dump|dd\()",
-                "description": "Debug statement detected",
-                "severity": "low"
-            },
-            {
-                "name": "todo_comment",
-                "pattern": r"(?://|#|<!--|/\*)\s*TODO:",
-                "description": "TODO comment detected",
-                "severity": "low"
-            },
-            {
-                "name": "fixme_comment",
-                "pattern": r"(?://|#|<!--|/\*)\s*FIXME:",
-                "description": "FIXME comment detected",
-                "severity": "medium"
-            },
-            {
-                "name": "commented_code",
-                "pattern": r"(?://|#|<!--|/\*)\s*(?:function|def|class|if|for|while)\b",
-                "description": "Commented out code detected",
-                "severity": "low"
-            },
-            {
-                "name": "exception_swallowing",
-                "pattern": r"(?:try\s*{[^}]*}\s*catch\s*\([^)]*\)\s*{[^}]*}|try:[^\n]*\n\s*except(?:\s+\w+)?:[^\n]*\n\s*pass\b)",
-                "description": "Exception swallowing detected",
-                "severity": "medium"
-            },
-            {
-                "name": "magic_number",
-                "pattern": r"(?<!\w)(?:[0-9]{4,}|0x[0-9a-fA-F]{3,})(?!\w)",
-                "description": "Magic number detected",
-                "severity": "low"
-            },
-            {
-                "name": "nested_loop",
-                "pattern": r"(?:for\s*\([^)]*\)\s*{[^{]*for\s*\([^)]*\)|for\s+\w+\s+in\s+[^:]+:\s*\n\s+for\s+\w+\s+in\s+)",
-                "description": "Nested loop detected",
-                "severity": "low"
-            },
-            {
-                "name": "sql_injection",
-                "pattern": r"(?:\"SELECT\s+.*\"\s*\+\s*|'SELECT\s+.*'\s*\+\s*|\"INSERT\s+INTO\s+.*\"\s*\+\s*|'INSERT\s+INTO\s+.*'\s*\+\s*)",
-                "description": "Potential SQL injection risk",
-                "severity": "high"
-            },
-            {
-                "name": "shell_injection",
-                "pattern": r"(?:os\.system\(.*\+|subprocess\.call\(.*\+|exec\(.*\+|eval\(.*\+)",
-                "description": "Potential shell injection risk",
-                "severity": "high"
-            },
-            {
-                "name": "unhandled_error",
-                "pattern": r"throw\s+new\s+Error\((?!\".*notImplemented)",
-                "description": "Unhandled error detected",
-                "severity": "medium"
-            },
-            {
-                "name": "copilot_marker",
-                "pattern": r"(?:Copilot|GitHub Copilot|@ai\/suggestion|@copilot\/suggestion)",
-                "description": "GitHub Copilot marker detected",
-                "severity": "high"
-            },
-            {
-                "name": "chatgpt_marker",
-                "pattern": r"(?:ChatGPT|GPT-3|GPT-4|OpenAI|gpt\.|GPT\.|Model:\s*GPT)",
-                "description": "ChatGPT marker detected",
-                "severity": "high"
-            },
-            {
-                "name": "unnecessary_comment",
-                "pattern": r"(?://|#)\s*(?:This function|This method|This class)\s+(?:is|does|implements|handles)",
-                "description": "Unnecessary explanatory comment",
-                "severity": "low"
-            },
-            {
-                "name": "default_export",
-                "pattern": r"export\s+default\s+(?:function|class|const|let|var)",
-                "description": "Default export detected (could indicate boilerplate)",
-                "severity": "low"
-            }
-        ]
-
-        self.rules = default_rules
+        self.rules = list(_DEFAULT_RULES)
 
         rule_files = list(self.rule_dir.glob("*.json"))
         for rule_file in rule_files:
             try:
-                with open(rule_file, 'r') as f:
-                    custom_rules = json.load(f)
+                custom_rules = json_utils.loads(rule_file.read_bytes())
 
                 if isinstance(custom_rules, list):
                     self.custom_rules.extend(custom_rules)
@@ -131,32 +262,74 @@ class RuleEngine:
             except Exception:
                 pass
 
+        self._compile_rules()
+
+    def _compile_rules(self) -> None:
+        """Compile every rule and recompute the cheap checks used to skip content no rule can match."""
+        self._compiled_rules = []
+        min_lens = []
+        required = set()
+        for rule in self.rules + self.custom_rules:
+            pattern = rule.get("pattern")
+            if not pattern:
+                continue
+
+            compiled = _compile_pattern(pattern)
+            if compiled is None:
+                continue
+
+            regex, min_len, chars = compiled
+            self._compiled_rules.append((
+                regex,
+                rule.get("name", "unknown"),
+                rule.get("description", ""),
+                rule.get("severity", "medium")
+            ))
+
+            min_lens.append(min_len)
+            if required is not None:
+                if chars is None:
+                    required = None
+                else:
+                    required.update(chars)
+
+        self._min_match_len = min(min_lens, default=0)
+        self._required_chars = frozenset(required) if required is not None else None
+
+    def _may_match(self, content: str) -> bool:
+        if len(content) < self._min_match_len:
+            return False
+        if self._required_chars is not None and self._required_chars.isdisjoint(content):
+            return False
+        return True
+
     def check_content(self, content: str) -> List[Dict[str, Any]]:
         if not content:
             return []
 
-        all_rules = self.rules + self.custom_rules
+        compiled_rules = self._compiled_rules if self._may_match(content) else []
+        offsets = None
         results = []
 
-        for rule in all_rules:
-            pattern = rule.get("pattern")
-            if not pattern:
+        for regex, rule_name, description, severity in compiled_rules:
+            matches = list(regex.finditer(content))
+            if not matches:
                 continue
 
-            try:
-                matches = re.finditer(pattern, content, re.MULTILINE)
-
-                for match in matches:
-                    line_number = content[:match.start()].count('\n') + 1
-                    results.append({
-                        "rule": rule.get("name", "unknown"),
-                        "description": rule.get("description", ""),
-                        "line": line_number,
-                        "match": match.group(0),
-                        "severity": rule.get("severity", "medium")
-                    })
-            except re.error:
-                pass
+            # Most content has no matches, so the newline index is built for the first rule that has some
+            if offsets is None:
+                offsets = newline_offsets(content)
+
+            results.extend([
+                {
+                    "rule": rule_name,
+                    "description": description,
+                    "line": line_number(offsets, match.start()),
+                    "match": match.group(0),
+                    "severity": severity
+                }
+                for match in matches
+            ])
 
         for plugin in self.plugins:
             if hasattr(plugin, "check_content") and callable(plugin.check_content):
@@ -194,22 +367,34 @@ class RuleEngine:
         }
 
         self.custom_rules.append(new_rule)
+        self._pending_rules.append(new_rule)
+
+        # While plugins register rules, compiling and saving happen once at the end
+        if self._suppress_save:
+            return True
+
+        self._compile_rules()
+        return self._save_rules()
+
+    def _save_rules(self) -> bool:
+        """Append the rules added since the last save to custom_rules.json in a single write."""
+        pending_rules, self._pending_rules = self._pending_rules, []
+        if not pending_rules:
+            return True
 
         custom_rules_file = self.rule_dir / "custom_rules.json"
 
         try:
             existing_rules = []
             if custom_rules_file.exists():
-                with open(custom_rules_file, 'r') as f:
-                    existing_rules = json.load(f)
+                existing_rules = json_utils.loads(custom_rules_file.read_bytes())
 
             if not isinstance(existing_rules, list):
                 existing_rules = []
 
-            existing_rules.append(new_rule)
+            existing_rules.extend(pending_rules)
 
-            with open(custom_rules_file, 'w') as f:
-                json.dump(existing_rules, f, indent=2)
+            custom_rules_file.write_bytes(json_utils.dumps(existing_rules, indent=True))
 
             return True
         except Exception:
@@ -225,12 +410,13 @@ class RuleEngine:
         if len(self.custom_rules) == initial_count:
             return False
 
+        self._compile_rules()
+
         custom_rules_file = self.rule_dir / "custom_rules.json"
 
         try:
             if custom_rules_file.exists():
-                with open(custom_rules_file, 'w') as f:
-                    json.dump(self.custom_rules, f, indent=2)
+                custom_rules_file.write_bytes(json_utils.dumps(self.custom_rules, indent=True))
 
             return True
         except Exception:
@@ -247,7 +433,14 @@ class RuleEngine:
         return None
 
     def load_plugin(self, plugin_path: str) -> bool:
+        # Plugin machinery is imported here so that runs without plugins skip it.
+        import importlib
+        import importlib.util
+        from .plugin_base import PluginBase
+
+        self._suppress_save = True
         try:
+            registry_size = len(PluginBase._registry)
             if os.path.exists(plugin_path):
                 module_name = os.path.basename(plugin_path).replace(".py", "")
                 spec = importlib.util.spec_from_file_location(module_name, plugin_path)
@@ -266,7 +459,7 @@ class RuleEngine:
             if hasattr(plugin_module, "check_content") and callable(plugin_module.check_content):
                 self.plugins.append(plugin_module)
                 
-            plugin_classes = self._find_plugin_classes(plugin_module)
+            plugin_classes = self._find_plugin_classes(plugin_module, registry_size)
             if plugin_classes:
                 for plugin_class in plugin_classes:
                     plugin_instance = plugin_class()
@@ -300,15 +493,24 @@ class RuleEngine:
         except Exception as e:
             print(f"Error loading plugin: {e}")
             return False
-
-    def _find_plugin_classes(self, module) -> List[Type[PluginBase]]:
-        """Find all plugin classes in a module."""
-        plugin_classes = []
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and 
-                issubclass(obj, PluginBase) and 
-                obj is not PluginBase):
-                plugin_classes.append(obj)
+        finally:
+            self._suppress_save = False
+            self._compile_rules()
+            self._save_rules()
+
+    def _find_plugin_classes(self, module, registry_size: int) -> List[Type["PluginBase"]]:
+        """Find the plugin classes defined by a module.
+
+        Classes registered since ``registry_size`` were defined while the
+        module executed. A module that was already imported defines nothing
+        new, so fall back to the registered classes that belong to it.
+        """
+        from .plugin_base import PluginBase
+
+        plugin_classes = PluginBase._registry[registry_size:]
+        if not plugin_classes:
+            module_name = getattr(module, "__name__", None)
+            plugin_classes = [cls for cls in PluginBase._registry if cls.__module__ == module_name]
         return plugin_classes
 
     def unload_all_plugins(self) -> None:
@@ -335,10 +537,7 @@ class RuleEngine:
 
     def check_file(self, file_path: str) -> List[Dict[str, Any]]:
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            results = self.check_content(content)
+            results = self.check_content(_read_text(file_path))
 
             for result in results:
                 result["file"] = file_path
@@ -347,6 +546,36 @@ class RuleEngine:
         except Exception:
             return []
 
+    def check_files_streaming(self, file_paths: Iterable[str], io_workers: int = 4,
+                              max_pending: int = 32) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Check many files, reading ahead on a thread pool while earlier files are scanned.
+        
+        Reads release the GIL, so disk I/O overlaps with the regex work done
+        on the calling thread. At most ``max_pending`` files are held in memory.
+        
+        Args:
+            file_paths: Paths of the files to check
+            io_workers: Number of threads reading files
+            max_pending: Maximum number of files read ahead of the scanner
+        
+        Yields:
+            (file_path, results) pairs in the order the paths were given
+        """
+        for file_path, read in read_ahead(file_paths, _read_text, io_workers, max_pending):
+            yield self._check_read_file(file_path, read)
+
+    def _check_read_file(self, file_path: str, read: Future) -> Tuple[str, List[Dict[str, Any]]]:
+        try:
+            results = self.check_content(read.result())
+        except Exception:
+            return file_path, []
+
+        for result in results:
+            result["file"] = file_path
+
+        return file_path, results
+
     def get_loaded_plugins(self) -> List[Any]:
         """Get all currently loaded plugins."""
         return self.plugins + self.plugin_instances
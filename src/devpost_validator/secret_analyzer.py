@@ -1,73 +1,300 @@
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, FrozenSet, Pattern, Union
 import re
 from pathlib import Path
-import json
 import os
 import hashlib
+import math
+import mmap
+import sqlite3
+import fnmatch
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+from . import json_utils
+from .file_utils import iter_repo_files
+from .text_utils import IGNORECASE_ASCII_FOLDS, decode_text, line_number, newline_offsets
+
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 64
+
+# Files handed to a pool worker per task.
+_SCAN_CHUNKSIZE = 32
+
+# Files larger than this are data or logs rather than source, so they are not scanned.
+_MAX_SCAN_BYTES = 2 * 1024 * 1024
+
+# Files at least this large are memory-mapped rather than read into a bytes object.
+_MMAP_MIN_BYTES = 256 * 1024
+
+# Leading bytes inspected to decide whether an extensionless file is text.
+_SNIFF_BYTES = 1024
+_HIGH_BIT_BYTES = bytes(range(128, 256))
+
+# Exclude patterns containing any of these are shell globs rather than exact names.
+_GLOB_CHARS = frozenset("*?[")
+
+_SECRET_PATTERNS = (
+    (r"(?i)(?:api|access)[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z]{32}|[0-9a-z]{16}|[0-9a-z]{64})", "API Key/Token", "high"),
+    (r"(?:(?<![a-z])(?i:key|token|secret)|(?<=[a-z])(?:Key|Token|Secret|KEY|TOKEN|SECRET))[\"']?[ \t]*[=:][ \t]*[\"']?[A-Za-z0-9_-]{32,64}\b", "Potential API Key/Token", "medium"),
+
+    (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID", "critical"),
+    (r"(?i)aws[-_]?(?:access|secret|session)[-_]?key[-_]?(?:id)?[-_]?[=: \"']+([^'\"\s]{16,})", "AWS Key", "critical"),
+
+    (r"(?i)github[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z]{35,40})", "GitHub Token", "critical"),
+    (r"gh[pousr]_[A-Za-z0-9_]{36,255}", "GitHub Personal Access Token", "critical"),
+
+    (r"AIza[0-9A-Za-z-_]{35}", "Google API Key", "critical"),
+    (r"(?i)google[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z-_]{24,})", "Google Key", "critical"),
+
+    (r"(?i)discord(?:app)?[-_]?[a-z0-9]{24,}", "Discord Token", "critical"),
+
+    (r"(?i)xox[baprs]-\d{12}-\d{12}-\d{24}", "Slack Token", "critical"),
+
+    (r"(?i)twilio[-_]?(?:account|api|auth|sid)[-_]?[a-z0-9]{32}", "Twilio API Key", "critical"),
+
+    (r"(?i)azure[-_]?(?:key|token|secret)[-_]?(?:[0-9a-zA-Z]{44})", "Azure Key", "critical"),
+
+    (r"eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*", "JWT Token", "high"),
+
+    (r"(?i)sk_(?:test|live)_[0-9a-z]{24,}", "Stripe API Key", "critical"),
+    (r"(?i)pk_(?:test|live)_[0-9a-z]{24,}", "Stripe Publishable Key", "high"),
+
+    (r"(?i)(?:password|passwd|pwd)[-_]?[=: \"']+([^'\"\s]{8,})", "Password", "high"),
+    (r"(?i)(?:secret|token)[-_]?[=: \"']+([^'\"\s]{8,})", "Secret", "high"),
+
+    (r"(?i)(?:mongodb(?:\+srv)?|postgres(?:ql)?|mysql|redis)://[^'\"\s]{8,}", "Database Connection String", "critical"),
+    (r"(?i)(?:mongodb|postgres(?:ql)?|mysql|redis)[-_]?(?:uri|url|connection|host)", "Database Connection Reference", "medium"),
+
+    (r"(?i)(?:SECRET_|TOKEN_|PASSWORD_|KEY_)[A-Z0-9_]+=.+", "Environment Variable", "high"),
+
+    (r"(?i)-----BEGIN (?:RSA|OPENSSH|DSA|EC|PGP) PRIVATE KEY( BLOCK)?-----", "Private Key", "critical"),
+
+    (r"(?i)oauth[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z]{32,})", "OAuth Token", "high"),
+
+    (r"(?i)(?:https?|ftp)://[^:@\s]+:[^@\s]+@.+", "URL with Credentials", "high"),
+)
+
+# Lowercase literals at least one of which appears in every case-folded match
+# of the pattern for each secret type. A pattern is skipped for content that
+# contains none of its keywords.
+_SECRET_KEYWORDS = {
+    "API Key/Token": ("api", "access"),
+    "Potential API Key/Token": ("key", "token", "secret"),
+    "AWS Access Key ID": ("akia",),
+    "AWS Key": ("aws",),
+    "GitHub Token": ("github",),
+    "GitHub Personal Access Token": ("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
+    "Google API Key": ("aiza",),
+    "Google Key": ("google",),
+    "Discord Token": ("discord",),
+    "Slack Token": ("xox",),
+    "Twilio API Key": ("twilio",),
+    "Azure Key": ("azure",),
+    "JWT Token": ("eyj",),
+    "Stripe API Key": ("sk_test", "sk_live"),
+    "Stripe Publishable Key": ("pk_test", "pk_live"),
+    "Password": ("passw", "pwd"),
+    "Secret": ("secret", "token"),
+    "Database Connection String": ("mongodb", "postgres", "mysql", "redis"),
+    "Database Connection Reference": ("mongodb", "postgres", "mysql", "redis"),
+    "Environment Variable": ("secret_", "token_", "password_", "key_"),
+    "Private Key": ("-----begin ",),
+    "OAuth Token": ("oauth",),
+    "URL with Credentials": ("://",),
+}
+
+_PATTERN_KEYWORDS = {
+    pattern: frozenset(_SECRET_KEYWORDS[secret_type]) for pattern, secret_type, _ in _SECRET_PATTERNS
+}
+_ALL_KEYWORDS = frozenset().union(*_PATTERN_KEYWORDS.values())
 
-class SecretAnalyzer:
-    def __init__(self):
-        self.secret_patterns = [
+# Applied before str.lower() so keywords are found wherever IGNORECASE would match them
+_EXTRA_CASE_FOLDS = str.maketrans(IGNORECASE_ASCII_FOLDS)
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ALL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+    del _keyword
+else:
+    _KEYWORD_AUTOMATON = None
 
-            (r"(?i)(?:api|access)[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z]{32}|[0-9a-z]{16}|[0-9a-z]{64})", "API Key/Token", "high"),
-            (r"(?:[a-z0-9_-]{32,64})\b", "Potential API Key/Token", "medium"),
-            
 
-            (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID", "critical"),
-            (r"(?i)aws[-_]?(?:access|secret|session)[-_]?key[-_]?(?:id)?[-_]?[=: \"']+([^'\"\\s]{16,})", "AWS Key", "critical"),
-            
+def _present_keywords(content: str) -> FrozenSet[str]:
+    """Return the secret keywords that occur in ``content``, ignoring case."""
+    if not content.isascii():
+        content = content.translate(_EXTRA_CASE_FOLDS)
+    lowered = content.lower()
+    
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(lowered))
+    return frozenset(keyword for keyword in _ALL_KEYWORDS if keyword in lowered)
+
 
-            (r"(?i)github[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z]{35,40})", "GitHub Token", "critical"),
-            (r"gh[pousr]_[A-Za-z0-9_]{36,255}", "GitHub Personal Access Token", "critical"),
-            
+# Secret types whose distinctive prefix makes a match reliable enough to skip
+# the false-positive heuristics.
+_HIGH_CONFIDENCE_TYPES = frozenset({
+    "AWS Access Key ID",
+    "Google API Key",
+    "GitHub Personal Access Token",
+    "Private Key",
+    "Slack Token",
+})
 
-            (r"AIza[0-9A-Za-z-_]{35}", "Google API Key", "critical"),
-            (r"(?i)google[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z-_]{24,})", "Google Key", "critical"),
-            
+_HIGH_CONFIDENCE_PATTERNS = frozenset(
+    pattern for pattern, secret_type, _ in _SECRET_PATTERNS if secret_type in _HIGH_CONFIDENCE_TYPES
+)
 
+_PLACEHOLDER_PATTERN = re.compile("|".join(map(re.escape, [
+    "YOUR_API_KEY", "YOUR_SECRET", "your-secret-key", "EXAMPLE_KEY", "SAMPLE_TOKEN"
+])))
 
-            (r"(?i)discord(?:app)?[-_]?[a-z0-9]{24,}", "Discord Token", "critical"),
+_IMPORT_LINE_PATTERN = re.compile(r"\s*(?:import|from|require|include)")
 
 
+def _is_word_char(char: str) -> bool:
+    """Check whether a character is matched by \\w in a str pattern."""
+    return char.isalnum() or char == "_"
 
-            (r"(?i)xox[baprs]-\d{12}-\d{12}-\d{24}", "Slack Token", "critical"),
 
+# Compiled once per process and shared by every SecretAnalyzer instance.
+_COMPILED_SECRET_PATTERNS = tuple(
+    (re.compile(pattern), secret_type, risk, pattern) for pattern, secret_type, risk in _SECRET_PATTERNS
+)
 
 
-            (r"(?i)twilio[-_]?(?:account|api|auth|sid)[-_]?[a-z0-9]{32}", "Twilio API Key", "critical"),
+if re2 is not None:
+    # Patterns RE2 rejects fall back to re, so its parse errors need not reach stderr
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
 
 
+def _compile_re2(compiled: Tuple[Any, str, str, str]) -> Tuple[Any, str, str, str]:
+    regex, secret_type, risk, pattern = compiled
+    try:
+        return re2.compile(pattern, _RE2_OPTIONS), secret_type, risk, pattern
+    except Exception:
+        return compiled
 
-            (r"(?i)azure[-_]?(?:key|token|secret)[-_]?(?:[0-9a-zA-Z]{44})", "Azure Key", "critical"),
-            
 
-            (r"eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*", "JWT Token", "high"),
-            
+# RE2 versions of the secret patterns, keeping the re version of any pattern RE2 rejects.
+_RE2_SECRET_PATTERNS = tuple(map(_compile_re2, _COMPILED_SECRET_PATTERNS)) if re2 is not None else None
 
-            (r"(?i)sk_(?:test|live)_[0-9a-z]{24,}", "Stripe API Key", "critical"),
-            (r"(?i)pk_(?:test|live)_[0-9a-z]{24,}", "Stripe Publishable Key", "high"),
-            
+# (pattern, secret_type, risk) -> compiled entry, reused by every instance for its default patterns
+_SHARED_SECRET_PATTERNS = dict(zip(_SECRET_PATTERNS, _COMPILED_SECRET_PATTERNS))
+_SHARED_RE2_SECRET_PATTERNS = dict(zip(_SECRET_PATTERNS, _RE2_SECRET_PATTERNS)) if re2 is not None else None
 
-            (r"(?i)(?:password|passwd|pwd)[-_]?[=: \"']+([^'\"\\s]{8,})", "Password", "high"),
-            (r"(?i)(?:secret|token)[-_]?[=: \"']+([^'\"\\s]{8,})", "Secret", "high"),
-            
+# RE2 and Hyperscan classes such as \s, \b and case folding are ASCII-only, and
+# their \s does not agree with re on \v and \x1c-\x1f. On ASCII content without
+# those characters they find exactly the same matches as re.
+_ENGINE_MISMATCH_CHARS = re.compile(r"[\x0b\x1c-\x1f]")
 
-            (r"(?i)(?:mongodb(?:\+srv)?|postgres(?:ql)?|mysql|redis)://[^'\"\\s]{8,}", "Database Connection String", "critical"),
-            (r"(?i)(?:mongodb|postgres(?:ql)?|mysql|redis)[-_]?(?:uri|url|connection|host)", "Database Connection Reference", "medium"),
-            
+# Hyperscan database reporting which secret patterns match, built on first use.
+_hyperscan_database = None
+_hyperscan_patterns: FrozenSet[str] = frozenset()
+_hyperscan_compiled = False
 
-            (r"(?i)(?:SECRET_|TOKEN_|PASSWORD_|KEY_)[A-Z0-9_]+=.+", "Environment Variable", "high"),
-            
 
-            (r"(?i)-----BEGIN (?:RSA|OPENSSH|DSA|EC|PGP) PRIVATE KEY( BLOCK)?-----", "Private Key", "critical"),
-            
+def _compile_hyperscan() -> None:
+    """
+    Compile the secret patterns that Hyperscan supports into one database that
+    reports each pattern at most once per scan.
+    """
+    global _hyperscan_database, _hyperscan_patterns, _hyperscan_compiled
+    _hyperscan_compiled = True
+    
+    def compile_database(indexes: List[int]):
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[_SECRET_PATTERNS[index][0].encode() for index in indexes],
+            ids=indexes,
+            elements=len(indexes),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(indexes)
+        )
+        return database
+    
+    supported = list(range(len(_SECRET_PATTERNS)))
+    try:
+        database = compile_database(supported)
+    except hyperscan.error:
+        # Drop the patterns Hyperscan rejects; they always run through re
+        supported = []
+        for index in range(len(_SECRET_PATTERNS)):
+            try:
+                compile_database([index])
+            except hyperscan.error:
+                continue
+            supported.append(index)
+        
+        if not supported:
+            return
+        database = compile_database(supported)
+    
+    _hyperscan_database = database
+    _hyperscan_patterns = frozenset(_SECRET_PATTERNS[index][0] for index in supported)
 
-            (r"(?i)oauth[-_]?(?:key|token|secret)[-_]?(?:[0-9a-z]{32,})", "OAuth Token", "high"),
-            
 
-            (r"(?i)(?:https?|ftp)://[^:@]+:[^@]+@.+", "URL with Credentials", "high"),
-        ]
+def _hyperscan_unmatched_patterns(content: str) -> Optional[FrozenSet[str]]:
+    """
+    Return the secret patterns Hyperscan proves have no match in ``content``,
+    or None if Hyperscan is unavailable.
+    """
+    if hyperscan is None:
+        return None
+    if not _hyperscan_compiled:
+        try:
+            _compile_hyperscan()
+        except hyperscan.error:
+            return None
+    if _hyperscan_database is None:
+        return None
+    
+    matched_ids = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        matched_ids.add(pattern_id)
+    
+    _hyperscan_database.scan(content.encode(), match_event_handler=on_match)
+    return _hyperscan_patterns.difference(_SECRET_PATTERNS[index][0] for index in matched_ids)
+
+
+# Scan results are cached in this SQLite database inside cache_dir, keyed by content hash.
+_CACHE_DB_NAME = "cache.sqlite"
+
+# Per-process analyzer used by pool workers, set up by _init_scan_worker.
+_worker_analyzer = None
+
+
+def _init_scan_worker(analyzer: "SecretAnalyzer") -> None:
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+    # Never share the parent's cache connection, whether the pool forks or spawns
+    _worker_analyzer._cache_db = None
+
+
+def _scan_one_file(job: Tuple[str, str, bool]) -> Optional[List[Dict[str, Any]]]:
+    return _worker_analyzer._scan_file(*job)
+
+
+class SecretAnalyzer:
+    def __init__(self):
+        self.secret_patterns = list(_SECRET_PATTERNS)
         
 
         self.sensitive_files = [
@@ -102,6 +329,9 @@ class SecretAnalyzer:
         self.exclude_patterns = [
             "node_modules",
             "venv",
+            ".venv",
+            "env",
+            "site-packages",
             ".git",
             "__pycache__",
             "build",
@@ -121,13 +351,31 @@ class SecretAnalyzer:
         
         self.cache_dir = Path.home() / ".devpost-validator" / "cache" / "secrets"
         self.cache_dir.mkdir(exist_ok=True, parents=True)
+        self._cache_db: Optional[sqlite3.Connection] = None
+
+        # secret_patterns as last compiled, and the re and RE2 entries compiled from it
+        self._compiled_source: Optional[List[Tuple[str, str, str]]] = None
+        self._compiled_patterns: Tuple[Tuple[Any, str, str, str], ...] = ()
+        self._re2_patterns: Optional[Tuple[Tuple[Any, str, str, str], ...]] = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # SQLite connections and RE2 patterns cannot be pickled; pool workers
+        # reconnect and recompile on first use
+        state = self.__dict__.copy()
+        state["_cache_db"] = None
+        state["_compiled_source"] = None
+        state["_compiled_patterns"] = ()
+        state["_re2_patterns"] = None
+        return state
     
-    def analyze_repo(self, repo_path: str) -> Dict[str, Any]:
+    def analyze_repo(self, repo_path: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze a repository for potential secrets and exposed sensitive data.
         
         Args:
             repo_path: Path to the local repository
+            max_workers: Number of worker processes for large repositories
+                (defaults to the number of CPUs)
         
         Returns:
             Dict with analysis results
@@ -146,70 +394,58 @@ class SecretAnalyzer:
         
         secrets_found = []
         sensitive_files_found = []
-        files_scanned = 0
+        scan_jobs = []
         total_files = 0
         
-        for root, dirs, files in os.walk(repo_path):
-
-            dirs[:] = [d for d in dirs if not any(pattern in d for pattern in self.exclude_patterns)]
+        exclude_names, exclude_glob = self._compile_exclude_patterns()
+        sensitive_names = frozenset(name.lower() for name in self.sensitive_files)
+        sensitive_extensions = tuple(ext.lower() for ext in self.sensitive_extensions)
+        
+        def is_excluded_dir(entry: os.DirEntry) -> bool:
+            name_lower = entry.name.lower()
+            return name_lower in exclude_names or bool(exclude_glob and exclude_glob.match(name_lower))
+        
+        for entry, rel_path in iter_repo_files(repo_path, is_excluded_dir):
+            total_files += 1
+            file = entry.name
+            name_lower = file.lower()
             
-            for file in files:
-                total_files += 1
-                
-
-                if any(pattern in file for pattern in self.exclude_patterns):
-                    continue
-                
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, repo_path)
-                
-
-                is_sensitive = (file.lower() in map(str.lower, self.sensitive_files) or 
-                               any(file.lower().endswith(ext) for ext in self.sensitive_extensions))
-                
-                if is_sensitive:
-                    sensitive_files_found.append({
-                        "file": rel_path,
-                        "risk": "high",
-                        "reason": "Sensitive file by name or extension"
-                    })
-                
-
-                if not self._is_text_file(file_path):
-                    continue
-                
-                files_scanned += 1
-                
-                try:
-
-                    file_hash = self._hash_file(file_path)
-                    cached_results = self._check_cache(file_hash)
-                    
-                    if cached_results:
-                        if cached_results.get("secrets", []):
-                            secrets_found.extend(cached_results["secrets"])
-                        if cached_results.get("sensitive_files", []):
-                            sensitive_files_found.extend(cached_results["sensitive_files"])
-                        continue
-                    
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
 
-                    file_secrets = self._scan_for_secrets(content, rel_path)
-                    
-                    if file_secrets:
-                        secrets_found.extend(file_secrets)
-                    
+            if name_lower in exclude_names or (exclude_glob and exclude_glob.match(name_lower)):
+                continue
+            
 
-                    self._cache_result(file_hash, {
-                        "secrets": file_secrets,
-                        "sensitive_files": [sf for sf in sensitive_files_found if sf["file"] == rel_path]
-                    })
-                    
-                except Exception as e:
+            is_sensitive = name_lower in sensitive_names or name_lower.endswith(sensitive_extensions)
+            
+            if is_sensitive:
+                sensitive_files_found.append({
+                    "file": rel_path,
+                    "risk": "high",
+                    "reason": "Sensitive file by name or extension"
+                })
+            
 
+            if not self._is_text_file(file):
+                continue
+            
+            try:
+                if entry.stat().st_size > _MAX_SCAN_BYTES:
                     continue
+            except OSError:
+                continue
+            
+            # Extensionless files are sniffed from the same bytes read for scanning
+            sniff = not os.path.splitext(file)[1]
+            scan_jobs.append((entry.path, rel_path, sniff))
+        
+        files_scanned = 0
+        
+        for file_secrets in self._scan_files(scan_jobs, max_workers):
+            if file_secrets is None:
+                continue
+            
+            files_scanned += 1
+            secrets_found.extend(file_secrets)
         
 
         if secrets_found or sensitive_files_found:
@@ -239,67 +475,198 @@ class SecretAnalyzer:
         
         return result
     
+    def _compile_exclude_patterns(self) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+        """
+        Split exclude_patterns into exact names and a single regex for the glob patterns,
+        both lowercased to match against lowercased file and directory names.
+        """
+        patterns = [pattern.lower() for pattern in self.exclude_patterns]
+        names = frozenset(pattern for pattern in patterns if _GLOB_CHARS.isdisjoint(pattern))
+        globs = [fnmatch.translate(pattern) for pattern in patterns if not _GLOB_CHARS.isdisjoint(pattern)]
+        
+        return names, re.compile("|".join(globs)) if globs else None
+    
+    def _scan_files(self, scan_jobs: List[Tuple[str, str, bool]],
+                    max_workers: Optional[int]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Scan (file_path, rel_path, sniff) jobs, in parallel processes when there are many.
+        """
+        # No more workers than there are chunks to hand out
+        workers = min(max_workers or os.cpu_count() or 1, math.ceil(len(scan_jobs) / _SCAN_CHUNKSIZE))
+        
+        if len(scan_jobs) >= _PARALLEL_MIN_FILES and workers > 1:
+            # SQLite connections must not be used across fork(), so close ours before the
+            # workers start; each worker and this process reconnect on their next cache access
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+            
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker,
+                                         initargs=(self,)) as executor:
+                    return list(executor.map(_scan_one_file, scan_jobs, chunksize=_SCAN_CHUNKSIZE))
+            except (OSError, BrokenProcessPool):
+                pass
+        
+        return [self._scan_file(*job) for job in scan_jobs]
+    
+    def _scan_file(self, file_path: str, rel_path: str, sniff: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Scan a single file, using cached results when its contents are unchanged.
+        
+        Args:
+            file_path: Path to the file on disk
+            rel_path: Path reported in findings
+            sniff: Skip the file unless its leading bytes look like text
+        
+        Returns:
+            The secrets found, or None if the file was not scanned
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+                    return self._scan_raw(f.read(), rel_path, sniff)
+                
+                # Map large files so hashing and decoding work on the page cache directly
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        raw.madvise(mmap.MADV_SEQUENTIAL)
+                    return self._scan_raw(raw, rel_path, sniff)
+        except Exception:
+            return None
+    
+    def _scan_raw(self, raw: Union[bytes, mmap.mmap], rel_path: str, sniff: bool) -> Optional[List[Dict[str, Any]]]:
+        if sniff and not self._looks_like_text(raw[:_SNIFF_BYTES]):
+            return None
+        
+        file_hash = self._hash_content(raw)
+        cached_results = self._check_cache(file_hash)
+        
+        if cached_results:
+            return cached_results.get("secrets", [])
+        
+        file_secrets = self._scan_for_secrets(decode_text(raw), rel_path)
+        self._cache_result(file_hash, {"secrets": file_secrets})
+        return file_secrets
+    
     def _scan_for_secrets(self, content: str, file_path: str) -> List[Dict[str, Any]]:
         """
-        Scan file content for secrets using regex patterns.
+        Scan file content for secrets, running each pattern once over the whole content.
         """
         findings = []
+        offsets = None
+        
+        compiled_patterns, re2_patterns = self._secret_patterns_compiled()
+        skipped_patterns = None
+        
+        if content.isascii() and not _ENGINE_MISMATCH_CHARS.search(content):
+            if re2_patterns is not None:
+                compiled_patterns = re2_patterns
+            skipped_patterns = _hyperscan_unmatched_patterns(content)
         
-        lines = content.split('\n')
+        if skipped_patterns is None:
+            present_keywords = _present_keywords(content)
+            skipped_patterns = frozenset(
+                pattern for pattern, keywords in _PATTERN_KEYWORDS.items() if keywords.isdisjoint(present_keywords)
+            )
         
-        for i, line in enumerate(lines):
-            for pattern, secret_type, risk in self.secret_patterns:
-                matches = re.finditer(pattern, line)
+        for index, (regex, secret_type, risk, pattern) in enumerate(compiled_patterns):
+            if pattern in skipped_patterns:
+                continue
+            
+            high_confidence = pattern in _HIGH_CONFIDENCE_PATTERNS
+            
+            for match in regex.finditer(content):
+                matched_value = match.group(0)
+                start = match.start()
                 
-                for match in matches:
-
-                    if self._is_likely_false_positive(line, match.group(0)):
-                        continue
-                    
-
-                    matched_value = match.group(0)
-                    masked_value = self._mask_secret(matched_value)
-                    
-                    findings.append({
-                        "file": file_path,
-                        "line": i + 1,
-                        "type": secret_type,
-                        "risk": risk,
-                        "matched_pattern": pattern,
-                        "matched_value": masked_value
-                    })
+                if not high_confidence:
+                    line_start = content.rfind('\n', 0, start) + 1
+                    line_end = content.find('\n', start)
+                    line = content[line_start:line_end] if line_end != -1 else content[line_start:]
                     
-        return findings
+                    if self._is_likely_false_positive(line, matched_value):
+                        continue
+                
+                # The newline index is only needed once something is reported
+                if offsets is None:
+                    offsets = newline_offsets(content)
+                
+                findings.append((index, {
+                    "file": file_path,
+                    "line": line_number(offsets, start),
+                    "type": secret_type,
+                    "risk": risk,
+                    "matched_pattern": pattern,
+                    "matched_value": self._mask_secret(matched_value)
+                }))
+        
+        findings.sort(key=lambda finding: (finding[1]["line"], finding[0]))
+        return [finding for _, finding in findings]
+    
+    def _secret_patterns_compiled(self) -> Tuple[Tuple[Tuple[Any, str, str, str], ...],
+                                                 Optional[Tuple[Tuple[Any, str, str, str], ...]]]:
+        """
+        Return the re and RE2 (or None) compiled forms of secret_patterns, recompiling
+        only after the list changes. Default patterns reuse the shared compiled entries.
+        """
+        source = [tuple(entry) for entry in self.secret_patterns]
+        if source != self._compiled_source:
+            self._compiled_patterns = tuple(
+                _SHARED_SECRET_PATTERNS.get(entry) or (re.compile(entry[0]), entry[1], entry[2], entry[0])
+                for entry in source
+            )
+            if re2 is not None:
+                self._re2_patterns = tuple(
+                    _SHARED_RE2_SECRET_PATTERNS.get(entry) or _compile_re2(compiled)
+                    for entry, compiled in zip(source, self._compiled_patterns)
+                )
+            self._compiled_source = source
+        
+        return self._compiled_patterns, self._re2_patterns
     
     def _is_likely_false_positive(self, line: str, matched_text: str) -> bool:
         """
         Check if a match is likely a false positive.
         """
 
-        if (("key" in line.lower() or "token" in line.lower() or "secret" in line.lower()) and 
-            (line.strip().startswith("#") or line.strip().startswith("//") or line.strip().startswith("/*")) and
-            len(matched_text) < 16):
+        if _PLACEHOLDER_PATTERN.search(matched_text):
             return True
         
 
-        if re.match(r"^\s*(?:import|from|require|include)", line):
+        if "//" in matched_text and ("http://" in matched_text or "https://" in matched_text):
             return True
         
 
-        if "//" in matched_text and ("http://" in matched_text or "https://" in matched_text):
-            return True
+        if len(matched_text) < 16 and line.lstrip().startswith(("#", "//", "/*")):
+            line_lower = line.lower()
+            if "key" in line_lower or "token" in line_lower or "secret" in line_lower:
+                return True
         
 
-        placeholders = ["YOUR_API_KEY", "YOUR_SECRET", "your-secret-key", "EXAMPLE_KEY", "SAMPLE_TOKEN"]
-        if any(placeholder in matched_text for placeholder in placeholders):
+        if _IMPORT_LINE_PATTERN.match(line):
             return True
         
 
-        if re.match(r".*[^\w]" + re.escape(matched_text) + r"[^\w].*", line) and "=" not in line:
+        if "=" not in line and self._is_delimited(line, matched_text):
             return True
         
         return False
     
+    def _is_delimited(self, line: str, text: str) -> bool:
+        """
+        Check whether ``text`` occurs in ``line`` with a non-word character on both sides.
+        """
+        start = line.find(text)
+        while start != -1:
+            end = start + len(text)
+            if (start > 0 and end < len(line)
+                    and not _is_word_char(line[start - 1]) and not _is_word_char(line[end])):
+                return True
+            start = line.find(text, start + 1)
+        
+        return False
+    
     def _mask_secret(self, secret: str) -> str:
         """
         Mask a secret to avoid exposing it in reports.
@@ -312,6 +679,9 @@ class SecretAnalyzer:
     def _is_text_file(self, file_path: str) -> bool:
         """
         Check if a file is a text file that should be scanned.
+        
+        Extensionless files pass this check; their contents are sniffed with
+        _looks_like_text when they are read for scanning.
         """
         try:
 
@@ -326,50 +696,51 @@ class SecretAnalyzer:
             
             ext = os.path.splitext(file_path)[1].lower()
             
-            if ext in text_extensions:
-                return True
-                
-
-            if not ext:
-                with open(file_path, 'rb') as f:
-                    content = f.read(1024)
-
-                    if sum(c > 127 for c in content) < len(content) * 0.3:
-                        return True
-            
-            return False
+            return ext in text_extensions or not ext
         except Exception:
             return False
     
-    def _hash_file(self, file_path: str) -> str:
+    def _looks_like_text(self, head: bytes) -> bool:
+        """
+        Check whether the leading bytes of a file look like text rather than binary data.
+        """
+        if b"\x00" in head:
+            return False
+        
+        high_bit = len(head) - len(head.translate(None, _HIGH_BIT_BYTES))
+        return high_bit < len(head) * 0.3
+    
+    def _hash_content(self, content: Union[bytes, mmap.mmap]) -> str:
         """Generate a hash for file contents to use as cache key."""
-        try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-                return hashlib.md5(content).hexdigest()
-        except Exception:
-
-            return hashlib.md5(file_path.encode()).hexdigest()
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+    
+    def _cache_connection(self) -> sqlite3.Connection:
+        """Open the cache database on first use, so each pool worker opens its own connection."""
+        if self._cache_db is None:
+            cache_db = sqlite3.connect(str(self.cache_dir / _CACHE_DB_NAME), isolation_level=None)
+            cache_db.execute("PRAGMA journal_mode=WAL")
+            cache_db.execute("PRAGMA synchronous=NORMAL")
+            cache_db.execute("CREATE TABLE IF NOT EXISTS secret_cache (hash TEXT PRIMARY KEY, result BLOB NOT NULL)")
+            self._cache_db = cache_db
+        return self._cache_db
     
     def _check_cache(self, file_hash: str) -> Optional[Dict[str, Any]]:
         """Check if we have cached results for this file."""
-        cache_file = self.cache_dir / f"{file_hash}.json"
-        
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-                
-        return None
+        try:
+            row = self._cache_connection().execute(
+                "SELECT result FROM secret_cache WHERE hash = ?", (file_hash,)
+            ).fetchone()
+            return json_utils.loads(row[0]) if row else None
+        except Exception:
+            return None
     
     def _cache_result(self, file_hash: str, result: Dict[str, Any]) -> None:
         """Cache the scan results for a file."""
         try:
-            cache_file = self.cache_dir / f"{file_hash}.json"
-            with open(cache_file, 'w') as f:
-                json.dump(result, f, indent=2)
+            self._cache_connection().execute(
+                "INSERT OR REPLACE INTO secret_cache (hash, result) VALUES (?, ?)",
+                (file_hash, json_utils.dumps(result))
+            )
         except Exception:
             pass
 
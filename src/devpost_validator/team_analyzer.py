@@ -3,6 +3,9 @@ from collections import Counter
 import statistics
 import math
 
+# Below this many contributors NumPy's call overhead outweighs its inner loop.
+_NUMPY_MIN_CONTRIBUTORS = 64
+
 
 class TeamAnalyzer:
     def __init__(self):
@@ -35,11 +38,7 @@ class TeamAnalyzer:
 
             if len(contributions) > 1 and sum(contributions) > 0:
                 # Calculate Gini coefficient for inequality
-                sorted_contrib = sorted(contributions)
-                n = len(sorted_contrib)
-                numerator = sum((i + 1) * c for i, c in enumerate(sorted_contrib))
-                denominator = n * sum(sorted_contrib)
-                gini = (2 * numerator / denominator) - (n + 1) / n
+                gini = self._calculate_gini(contributions)
 
                 # Invert Gini so 1.0 = perfectly balanced, 0.0 = completely imbalanced
                 result["contribution_balance"] = 1.0 - gini
@@ -82,8 +81,28 @@ class TeamAnalyzer:
 
         return result
 
+    def _calculate_gini(self, contributions: List[float]) -> float:
+        n = len(contributions)
+
+        if n >= _NUMPY_MIN_CONTRIBUTORS:
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+
+            if np is not None:
+                sorted_contrib = np.sort(np.asarray(contributions, dtype=np.float64))
+                ranks = np.arange(1, n + 1, dtype=np.float64)
+                return float(2 * np.dot(ranks, sorted_contrib) / (n * sorted_contrib.sum()) - (n + 1) / n)
+
+        sorted_contrib = sorted(contributions)
+        numerator = sum((i + 1) * c for i, c in enumerate(sorted_contrib))
+        denominator = n * sum(sorted_contrib)
+        return (2 * numerator / denominator) - (n + 1) / n
+
     def _calculate_team_match(self, devpost_members: List[str], github_contributors: List[Dict[str, Any]]) -> float:
         github_logins = [c.get("login", "").lower() for c in github_contributors]
+        github_login_set = set(github_logins)
 
         # Try exact matches
         matched_count = 0
@@ -91,24 +110,24 @@ class TeamAnalyzer:
             member_lower = member.lower()
 
             # Check for exact username match
-            if member_lower in github_logins:
+            if member_lower in github_login_set:
                 matched_count += 1
                 continue
 
+            # Split names into parts for better matching
+            member_parts = set(member_lower.replace('.', ' ').replace('-', ' ').replace('_', ' ').split())
+            significant_parts = [p for p in member_parts if len(p) > 2]
+            initials = {part[0] for part in member_parts}
+
             # Check for name in login or login in name
             for login in github_logins:
-                # Split names into parts for better matching
-                member_parts = set(member_lower.replace('.', ' ').replace('-', ' ').replace('_', ' ').split())
-                login_parts = set(login.replace('.', ' ').replace('-', ' ').replace('_', ' ').split())
-
                 # Check if any significant part matches
-                significant_parts = [p for p in member_parts if len(p) > 2]
                 if any(part in login for part in significant_parts):
                     matched_count += 0.8
                     break
 
                 # Check for initial-based usernames
-                if len(login) >= 2 and all(login.startswith(part[0]) for part in member_parts if part):
+                if len(login) >= 2 and all(login.startswith(initial) for initial in initials):
                     matched_count += 0.7
                     break
 
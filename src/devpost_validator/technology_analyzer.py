@@ -1,90 +1,411 @@
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterator, Callable, Pattern
 import os
 import re
-from pathlib import Path
+import copy
+import hashlib
 import json
 from collections import Counter
+from concurrent.futures import Future
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from .file_utils import iter_repo_files, read_ahead
+
+
+_EXCLUDED_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build", ".tox", ".mypy_cache",
+})
+
+
+def _is_pruned_dir(entry: os.DirEntry) -> bool:
+    # Excluded and hidden directories are not descended into
+    return entry.name in _EXCLUDED_DIRS or entry.name.startswith('.')
+
+
+# Imports and framework calls sit near the top of a source file; manifests are always read whole
+_SOURCE_READ_CHARS = 64 * 1024
+_LARGE_SOURCE_BYTES = 512 * 1024
+_LARGE_SOURCE_READ_CHARS = 8 * 1024
+_MAX_PENDING_READS = 32
+
+# A NUL byte this close to the start means the file is binary, not source text
+_SNIFF_BYTES = 1024
+
+
+def _safe_read(file_path: str, max_chars: int = -1) -> Optional[str]:
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        if b"\0" in f.buffer.peek(_SNIFF_BYTES)[:_SNIFF_BYTES]:
+            return None
+        return f.read(max_chars)
+
+
+_PYTHON_IMPORT_PATTERNS = tuple(
+    (re.compile(pattern, re.MULTILINE), tech) for pattern, tech in (
+        (r"import\s+flask", "flask"),
+        (r"from\s+flask", "flask"),
+        (r"import\s+django", "django"),
+        (r"from\s+django", "django"),
+        (r"import\s+fastapi", "fastapi"),
+        (r"from\s+fastapi", "fastapi"),
+        (r"import\s+numpy", "numpy"),
+        (r"import\s+pandas", "pandas"),
+        (r"import\s+tensorflow", "tensorflow"),
+        (r"import\s+torch", "pytorch"),
+        (r"import\s+sklearn", "scikit-learn"),
+        (r"from\s+sklearn", "scikit-learn"),
+        (r"import\s+matplotlib", "matplotlib"),
+        (r"import\s+pymongo", "mongodb"),
+        (r"import\s+sqlalchemy", "sqlalchemy"),
+        (r"import\s+psycopg2", "postgresql"),
+        (r"import\s+mysql", "mysql"),
+        (r"import\s+boto3", "aws"),
+        (r"import\s+firebase_admin", "firebase"),
+        (r"import\s+keras", "keras"),
+    )
+)
+
+_JS_IMPORT_PATTERNS = tuple(
+    (re.compile(pattern, re.MULTILINE), tech) for pattern, tech in (
+        (r"import\s+.*\s+from\s+['\"]react", "react"),
+        (r"import\s+.*\s+from\s+['\"]vue", "vue"),
+        (r"import\s+.*\s+from\s+['\"]@angular", "angular"),
+        (r"import\s+.*\s+from\s+['\"]express", "express"),
+        (r"import\s+.*\s+from\s+['\"]mongoose", "mongodb"),
+        (r"import\s+.*\s+from\s+['\"]sequelize", "sql"),
+        (r"import\s+.*\s+from\s+['\"]pg\b", "postgresql"),
+        (r"import\s+.*\s+from\s+['\"]mysql", "mysql"),
+        (r"import\s+.*\s+from\s+['\"]firebase", "firebase"),
+        (r"import\s+.*\s+from\s+['\"]@aws-sdk", "aws"),
+        (r"import\s+.*\s+from\s+['\"]@azure", "azure"),
+        (r"import\s+.*\s+from\s+['\"]@google-cloud", "gcp"),
+        (r"import\s+.*\s+from\s+['\"]redux", "redux"),
+        (r"import\s+.*\s+from\s+['\"]@apollo/client", "graphql"),
+        (r"import\s+.*\s+from\s+['\"]axios", "axios"),
+    )
+)
+
+_JAVA_IMPORT_PATTERNS = tuple(
+    (re.compile(pattern, re.MULTILINE), tech) for pattern, tech in (
+        (r"import\s+org\.springframework", "spring"),
+        (r"import\s+javax\.persistence", "jpa"),
+        (r"import\s+java\.sql", "jdbc"),
+        (r"import\s+com\.fasterxml\.jackson", "jackson"),
+        (r"import\s+org\.hibernate", "hibernate"),
+        (r"import\s+com\.google\.firebase", "firebase"),
+        (r"import\s+com\.amazonaws", "aws"),
+        (r"import\s+com\.azure", "azure"),
+        (r"import\s+com\.google\.cloud", "gcp"),
+        (r"import\s+io\.reactivex", "rxjava"),
+        (r"import\s+reactor\.core", "reactor"),
+        (r"import\s+org\.mongodb", "mongodb"),
+    )
+)
+
+_PYPROJECT_DEPENDENCY_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), tech) for pattern, tech in (
+        (r"flask\s*=", "flask"),
+        (r"django\s*=", "django"),
+        (r"fastapi\s*=", "fastapi"),
+        (r"numpy\s*=", "numpy"),
+        (r"pandas\s*=", "pandas"),
+        (r"tensorflow\s*=", "tensorflow"),
+        (r"torch\s*=", "pytorch"),
+        (r"scikit-learn\s*=", "scikit-learn"),
+        (r"matplotlib\s*=", "matplotlib"),
+        (r"pymongo\s*=", "mongodb"),
+        (r"sqlalchemy\s*=", "sqlalchemy"),
+        (r"psycopg2\s*=", "postgresql"),
+        (r"mysqlclient\s*=", "mysql"),
+        (r"boto3\s*=", "aws"),
+        (r"firebase-admin\s*=", "firebase"),
+        (r"google-cloud\s*=", "gcp"),
+        (r"azure-\w+\s*=", "azure"),
+    )
+)
+
+_POM_DEPENDENCY_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), tech) for pattern, tech in (
+        (r"<artifactId>spring-boot</artifactId>", "spring"),
+        (r"<artifactId>spring-webmvc</artifactId>", "spring"),
+        (r"<artifactId>hibernate-core</artifactId>", "hibernate"),
+        (r"<artifactId>mysql-connector-java</artifactId>", "mysql"),
+        (r"<artifactId>postgresql</artifactId>", "postgresql"),
+        (r"<artifactId>mongodb-driver</artifactId>", "mongodb"),
+        (r"<artifactId>aws-java-sdk</artifactId>", "aws"),
+        (r"<artifactId>azure-sdk</artifactId>", "azure"),
+        (r"<artifactId>google-cloud</artifactId>", "gcp"),
+        (r"<artifactId>firebase-admin</artifactId>", "firebase"),
+    )
+)
+
+_GRADLE_DEPENDENCY_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), tech) for pattern, tech in (
+        (r"org\.springframework\.boot", "spring"),
+        (r"org\.hibernate", "hibernate"),
+        (r"mysql-connector-java", "mysql"),
+        (r"org\.postgresql", "postgresql"),
+        (r"org\.mongodb", "mongodb"),
+        (r"com\.amazonaws", "aws"),
+        (r"com\.azure", "azure"),
+        (r"com\.google\.cloud", "gcp"),
+        (r"com\.google\.firebase", "firebase"),
+    )
+)
+
+_PACKAGE_JSON_DEPENDENCIES = {
+    "react": "react",
+    "react-dom": "react",
+    "vue": "vue",
+    "@vue/cli": "vue",
+    "@angular/core": "angular",
+    "express": "express",
+    "koa": "koa",
+    "next": "nextjs",
+    "nuxt": "nuxtjs",
+    "mongoose": "mongodb",
+    "sequelize": "sql",
+    "pg": "postgresql",
+    "mysql": "mysql",
+    "sqlite3": "sqlite",
+    "redis": "redis",
+    "firebase": "firebase",
+    "aws-sdk": "aws",
+    "@azure/core": "azure",
+    "@google-cloud/storage": "gcp",
+    "redux": "redux",
+    "apollo-client": "graphql",
+    "@apollo/client": "graphql",
+    "graphql": "graphql",
+    "tailwindcss": "tailwind",
+    "bootstrap": "bootstrap",
+    "jquery": "jquery",
+    "webpack": "webpack",
+    "jest": "jest",
+    "mocha": "mocha",
+    "cypress": "cypress",
+    "electron": "electron",
+    "typescript": "typescript",
+}
+
+_REQUIREMENTS_DEPENDENCIES = {
+    "flask": "flask",
+    "django": "django",
+    "fastapi": "fastapi",
+    "numpy": "numpy",
+    "pandas": "pandas",
+    "tensorflow": "tensorflow",
+    "torch": "pytorch",
+    "scikit-learn": "scikit-learn",
+    "matplotlib": "matplotlib",
+    "pymongo": "mongodb",
+    "sqlalchemy": "sqlalchemy",
+    "psycopg2": "postgresql",
+    "mysqlclient": "mysql",
+    "boto3": "aws",
+    "firebase-admin": "firebase",
+    "google-cloud": "gcp",
+    "azure-": "azure",
+    "pytest": "pytest",
+    "jupyter": "jupyter",
+}
+
+
+def _build_dependency_automaton(dependency_map: Dict[str, str]):
+    automaton = ahocorasick.Automaton()
+    for known_dep, tech in dependency_map.items():
+        automaton.add_word(known_dep, (known_dep, tech))
+    automaton.make_automaton()
+    return automaton
+
+
+_REQUIREMENTS_AUTOMATON = _build_dependency_automaton(_REQUIREMENTS_DEPENDENCIES) if ahocorasick is not None else None
+
+
+def _known_dependencies(name: str, dependency_map: Dict[str, str], automaton) -> Iterator[Tuple[str, str]]:
+    # Every known dependency that occurs somewhere in name; callers check where it occurs
+    if automaton is None:
+        return iter(dependency_map.items())
+    return (value for _, value in automaton.iter(name))
+
+
+# Markers containing any of these describe source code rather than file names
+_CONTENT_MARKER_TOKENS = (r"\s", r"\(", r"\$", "@", "`", ":", "\"")
+
+
+def _is_content_marker(pattern: str) -> bool:
+    return any(token in pattern for token in _CONTENT_MARKER_TOKENS)
+
+
+# Plain extension markers such as \.py$ are looked up by suffix instead of searched, and
+# other literal name endings such as package\.json$ are checked with str.endswith
+_EXTENSION_MARKER = re.compile(r"\\\.(\w+)\$")
+_LITERAL_SUFFIX_MARKER = re.compile(r"((?:[\w-]|\\\.)+)\$")
+
+# Content signatures made only of plain characters and escaped punctuation, such as Flask\(__name__\)
+_LITERAL_SIGNATURE = re.compile(r"(?:[^\\.^$*+?()\[\]{}|]|\\[^\w\s])+")
+
+_TECH_MARKERS = {
+    "python": (r"\.py$", r"requirements\.txt$", r"setup\.py$", r"Pipfile$", r"pyproject\.toml$"),
+    "javascript": (r"\.js$", r"package\.json$", r"yarn\.lock$", r"webpack\.config\.js$"),
+    "typescript": (r"\.ts$", r"\.tsx$", r"tsconfig\.json$"),
+    "react": (r"\.jsx$", r"\.tsx$", r"react", r"import\s+React"),
+    "vue": (r"\.vue$", r"vue\.config\.js$"),
+    "angular": (r"angular\.json$", r"\.component\.ts$"),
+    "node": (r"package\.json$", r"node_modules", r"express",
+             r"import\s+.*\s+from\s+['\"](express|koa|hapi|nest)"),
+    "java": (r"\.java$", r"pom\.xml$", r"build\.gradle$"),
+    "kotlin": (r"\.kt$", r"\.kts$"),
+    "swift": (r"\.swift$", r"Package\.swift$"),
+    "ruby": (r"\.rb$", r"Gemfile$", r"\.gemspec$"),
+    "php": (r"\.php$", r"composer\.json$"),
+    "go": (r"\.go$", r"go\.mod$"),
+    "rust": (r"\.rs$", r"Cargo\.toml$"),
+    "c": (r"\.c$", r"\.h$"),
+    "cpp": (r"\.cpp$", r"\.hpp$", r"\.cc$"),
+    "csharp": (r"\.cs$", r"\.csproj$", r"\.sln$"),
+    "flutter": (r"\.dart$", r"pubspec\.yaml$"),
+    "django": (r"settings\.py$", r"urls\.py$", r"models\.py$", r"views\.py$", r"from\s+django"),
+    "flask": (r"from\s+flask", r"Flask\("),
+    "fastapi": (r"from\s+fastapi", r"FastAPI\("),
+    "spring": (r"@SpringBootApplication", r"@RestController"),
+    "unity": (r"\.unity$", r"\.prefab$", r"\.mat$"),
+    "tensorflow": (r"import\s+tensorflow", r"from\s+tensorflow", r"tf\."),
+    "pytorch": (r"import\s+torch", r"from\s+torch"),
+    "docker": (r"Dockerfile", r"docker-compose\.yml$"),
+    "kubernetes": (r"\.yaml$", r"\.yml$", r"apiVersion:", r"kind:", r"kubectl"),
+    "html": (r"\.html$", r"\.htm$"),
+    "css": (r"\.css$", r"\.scss$", r"\.sass$", r"\.less$"),
+    "tailwind": (r"tailwind\.config\.js$", r"class=\".*tailwind"),
+    "bootstrap": (r"bootstrap", r"class=\".*bootstrap"),
+    "jquery": (r"jquery", r"\$\("),
+    "graphql": (r"\.graphql$", r"\.gql$", r"apollo", r"gql`"),
+    "sql": (r"\.sql$",),
+    "mongodb": (r"mongodb", r"mongoose"),
+    "postgresql": (r"postgres", r"psql", r"pg_"),
+    "mysql": (r"mysql", r"MariaDB"),
+    "redis": (r"redis",),
+    "aws": (r"aws", r"amazon", r"dynamodb", r"s3"),
+    "azure": (r"azure", r"microsoft cloud"),
+    "gcp": (r"gcp", r"google cloud"),
+    "firebase": (r"firebase", r"firestore"),
+    "machinelearning": (r"sklearn", r"scikit", r"pandas", r"numpy", r"matplotlib", r"keras")
+}
+
+_FILE_CONTENT_ANALYZERS = {
+    ".py": "_analyze_python_file",
+    ".js": "_analyze_js_file",
+    ".jsx": "_analyze_js_file",
+    ".ts": "_analyze_js_file",
+    ".tsx": "_analyze_js_file",
+    ".java": "_analyze_java_file",
+    "package.json": "_analyze_package_json",
+    "requirements.txt": "_analyze_requirements_txt",
+    "pyproject.toml": "_analyze_pyproject_toml",
+    "pom.xml": "_analyze_pom_xml",
+    "build.gradle": "_analyze_gradle_file",
+}
+
+_CONTENT_SIGNATURES = {
+    "react": (r"import\s+React", r"from\s+['\"](react|react-dom)",
+              r"React\.(Component|createClass|useState|useEffect)"),
+    "vue": (r"import\s+Vue", r"new\s+Vue\(", r"createApp\("),
+    "angular": (r"@angular", r"@Component", r"NgModule"),
+    "django": (r"from\s+django", r"urlpatterns", r"INSTALLED_APPS"),
+    "flask": (r"from\s+flask", r"Flask\(__name__\)"),
+    "express": (r"express\(\)", r"app\.get\(", r"app\.post\("),
+    "redux": (r"createStore", r"useSelector", r"useDispatch", r"combineReducers"),
+    "tensorflow": (r"import\s+tensorflow", r"tf\."),
+    "pytorch": (r"import\s+torch", r"torch\.nn"),
+    "mongodb": (r"mongoose", r"MongoClient", r"mongodb:\/\/"),
+    "graphql": (r"gql`", r"ApolloClient", r"useQuery"),
+}
+
+
+def _compile_filename_markers(tech_markers: Dict[str, Tuple[str, ...]]):
+    # Code-like markers never match a path; content signatures and the _analyze_* tables cover them
+    filename_markers = {}
+    for tech, patterns in tech_markers.items():
+        filename_patterns = [pattern for pattern in patterns if not _is_content_marker(pattern)]
+        if filename_patterns:
+            filename_markers[tech] = tuple(filename_patterns)
+
+    ext_to_techs: Dict[str, List[str]] = {}
+    suffix_markers: List[Tuple[str, str]] = []
+    literal_marker_res: List[Tuple[Pattern[str], str]] = []
+    path_markers: Dict[str, List[str]] = {}
+    for tech, patterns in filename_markers.items():
+        for pattern in patterns:
+            ext_match = _EXTENSION_MARKER.fullmatch(pattern)
+            suffix_match = _LITERAL_SUFFIX_MARKER.fullmatch(pattern)
+            if ext_match:
+                ext_to_techs.setdefault(f".{ext_match.group(1).lower()}", []).append(tech)
+            elif suffix_match:
+                suffix_markers.append((suffix_match.group(1).replace("\\.", ".").lower(), tech))
+            else:
+                path_markers.setdefault(tech, []).append(pattern)
+                continue
+            literal_marker_res.append((re.compile(pattern, re.IGNORECASE), tech))
+
+    tech_marker_res = {
+        tech: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+        for tech, patterns in path_markers.items()
+    }
+
+    # tech -> (lowercased literal markers, fused remaining markers or None) for ASCII paths
+    ascii_path_markers: Dict[str, Tuple[List[str], Optional[Pattern[str]]]] = {}
+    for tech, patterns in path_markers.items():
+        literals = [re.sub(r"\\(.)", r"\1", pattern).lower()
+                    for pattern in patterns if _LITERAL_SIGNATURE.fullmatch(pattern)]
+        regexes = [pattern for pattern in patterns if not _LITERAL_SIGNATURE.fullmatch(pattern)]
+        fused = re.compile("|".join(f"(?:{pattern})" for pattern in regexes), re.IGNORECASE) if regexes else None
+        ascii_path_markers[tech] = (literals, fused)
+
+    return filename_markers, ext_to_techs, suffix_markers, literal_marker_res, tech_marker_res, ascii_path_markers
+
+
+def _compile_content_signatures(content_signatures: Dict[str, Tuple[str, ...]]):
+    compiled = {
+        tech: [re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in patterns]
+        for tech, patterns in content_signatures.items()
+    }
+
+    # tech -> (lowercased literal signatures, compiled remaining signatures) for ASCII content
+    ascii_signatures: Dict[str, Tuple[List[str], List[Pattern[str]]]] = {}
+    for tech, patterns in content_signatures.items():
+        literals = []
+        regexes = []
+        for pattern in patterns:
+            if _LITERAL_SIGNATURE.fullmatch(pattern):
+                literals.append(re.sub(r"\\(.)", r"\1", pattern).lower())
+            else:
+                regexes.append(re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+        ascii_signatures[tech] = (literals, regexes)
+
+    return compiled, ascii_signatures
+
+
+(_FILENAME_MARKERS, _EXT_TO_TECHS, _SUFFIX_MARKERS, _LITERAL_MARKER_RES, _TECH_MARKER_RES,
+ _ASCII_PATH_MARKERS) = _compile_filename_markers(_TECH_MARKERS)
+_SUFFIX_GATE = tuple(suffix for suffix, _ in _SUFFIX_MARKERS)
+_COMPILED_CONTENT_SIGNATURES, _ASCII_CONTENT_SIGNATURES = _compile_content_signatures(_CONTENT_SIGNATURES)
 
 
 class TechnologyAnalyzer:
     def __init__(self):
-        self.tech_markers = {
-            "python": [r"\.py$", r"requirements\.txt$", r"setup\.py$", r"Pipfile$", r"pyproject\.toml$"],
-            "javascript": [r"\.js$", r"package\.json$", r"yarn\.lock$", r"webpack\.config\.js$"],
-            "typescript": [r"\.ts$", r"\.tsx$", r"tsconfig\.json$"],
-            "react": [r"\.jsx$", r"\.tsx$", r"react", r"import\s+React"],
-            "vue": [r"\.vue$", r"vue\.config\.js$"],
-            "angular": [r"angular\.json$", r"\.component\.ts$"],
-            "node": [r"package\.json$", r"node_modules", r"express",
-                     r"import\s+.*\s+from\s+['\"](express|koa|hapi|nest)"],
-            "java": [r"\.java$", r"pom\.xml$", r"build\.gradle$"],
-            "kotlin": [r"\.kt$", r"\.kts$"],
-            "swift": [r"\.swift$", r"Package\.swift$"],
-            "ruby": [r"\.rb$", r"Gemfile$", r"\.gemspec$"],
-            "php": [r"\.php$", r"composer\.json$"],
-            "go": [r"\.go$", r"go\.mod$"],
-            "rust": [r"\.rs$", r"Cargo\.toml$"],
-            "c": [r"\.c$", r"\.h$"],
-            "cpp": [r"\.cpp$", r"\.hpp$", r"\.cc$"],
-            "csharp": [r"\.cs$", r"\.csproj$", r"\.sln$"],
-            "flutter": [r"\.dart$", r"pubspec\.yaml$"],
-            "django": [r"settings\.py$", r"urls\.py$", r"models\.py$", r"views\.py$", r"from\s+django"],
-            "flask": [r"from\s+flask", r"Flask\("],
-            "fastapi": [r"from\s+fastapi", r"FastAPI\("],
-            "spring": [r"@SpringBootApplication", r"@RestController"],
-            "unity": [r"\.unity$", r"\.prefab$", r"\.mat$"],
-            "tensorflow": [r"import\s+tensorflow", r"from\s+tensorflow", r"tf\."],
-            "pytorch": [r"import\s+torch", r"from\s+torch"],
-            "docker": [r"Dockerfile", r"docker-compose\.yml$"],
-            "kubernetes": [r"\.yaml$", r"\.yml$", r"apiVersion:", r"kind:", r"kubectl"],
-            "html": [r"\.html$", r"\.htm$"],
-            "css": [r"\.css$", r"\.scss$", r"\.sass$", r"\.less$"],
-            "tailwind": [r"tailwind\.config\.js$", r"class=\".*tailwind"],
-            "bootstrap": [r"bootstrap", r"class=\".*bootstrap"],
-            "jquery": [r"jquery", r"\$\("],
-            "graphql": [r"\.graphql$", r"\.gql$", r"apollo", r"gql`"],
-            "sql": [r"\.sql$"],
-            "mongodb": [r"mongodb", r"mongoose"],
-            "postgresql": [r"postgres", r"psql", r"pg_"],
-            "mysql": [r"mysql", r"MariaDB"],
-            "redis": [r"redis"],
-            "aws": [r"aws", r"amazon", r"dynamodb", r"s3"],
-            "azure": [r"azure", r"microsoft cloud"],
-            "gcp": [r"gcp", r"google cloud"],
-            "firebase": [r"firebase", r"firestore"],
-            "machinelearning": [r"sklearn", r"scikit", r"pandas", r"numpy", r"matplotlib", r"keras"]
-        }
-
-        self.file_content_analyzers = {
-            ".py": self._analyze_python_file,
-            ".js": self._analyze_js_file,
-            ".jsx": self._analyze_js_file,
-            ".ts": self._analyze_js_file,
-            ".tsx": self._analyze_js_file,
-            ".java": self._analyze_java_file,
-            "package.json": self._analyze_package_json,
-            "requirements.txt": self._analyze_requirements_txt,
-            "pyproject.toml": self._analyze_pyproject_toml,
-            "pom.xml": self._analyze_pom_xml,
-            "build.gradle": self._analyze_gradle_file,
-        }
+        self.tech_markers = MappingProxyType(_TECH_MARKERS)
+        self.filename_markers = MappingProxyType(_FILENAME_MARKERS)
+        self.content_signatures = MappingProxyType(_CONTENT_SIGNATURES)
+        self.file_content_analyzers = {key: getattr(self, name) for key, name in _FILE_CONTENT_ANALYZERS.items()}
 
-        self.content_signatures = {
-            "react": [r"import\s+React", r"from\s+['\"](react|react-dom)",
-                      r"React\.(Component|createClass|useState|useEffect)"],
-            "vue": [r"import\s+Vue", r"new\s+Vue\(", r"createApp\("],
-            "angular": [r"@angular", r"@Component", r"NgModule"],
-            "django": [r"from\s+django", r"urlpatterns", r"INSTALLED_APPS"],
-            "flask": [r"from\s+flask", r"Flask\(__name__\)"],
-            "express": [r"express\(\)", r"app\.get\(", r"app\.post\("],
-            "redux": [r"createStore", r"useSelector", r"useDispatch", r"combineReducers"],
-            "tensorflow": [r"import\s+tensorflow", r"tf\."],
-            "pytorch": [r"import\s+torch", r"torch\.nn"],
-            "mongodb": [r"mongoose", r"MongoClient", r"mongodb:\/\/"],
-            "graphql": [r"gql`", r"ApolloClient", r"useQuery"],
-        }
+        # (repo_path, fingerprint of the walked files, result) for the last repository analyzed.
+        # Batch validation analyzes a fresh clone each time, so older entries would never hit
+        self._cache: Optional[Tuple[str, str, Dict[str, Any]]] = None
 
-    def analyze_repo(self, repo_path: str) -> Dict[str, Any]:
+    def analyze_repo(self, repo_path: str, io_workers: int = 4) -> Dict[str, Any]:
         result = {
             "detected_technologies": [],
             "primary_languages": [],
@@ -98,32 +419,28 @@ class TechnologyAnalyzer:
             "forbidden_used": [],
         }
 
-        tech_occurrences = {}
-        for tech in self.tech_markers:
-            tech_occurrences[tech] = 0
+        entries = [(entry, rel_path) for entry, rel_path in iter_repo_files(repo_path, _is_pruned_dir)
+                   if not entry.name.startswith('.')]
+        fingerprint = self._fingerprint(entries)
+        if self._cache is not None and self._cache[:2] == (repo_path, fingerprint):
+            return copy.deepcopy(self._cache[2])
 
-        total_files = 0
-        content_techs = set()
+        # Seeded in marker order so detected_technologies keeps a stable order
+        tech_occurrences = Counter(dict.fromkeys(self.tech_markers, 0))
 
-        for root, dirs, files in os.walk(repo_path):
-            if ".git" in root or "node_modules" in root or "__pycache__" in root:
-                continue
-
-            for filename in files:
-                if filename.startswith('.'):
-                    continue
+        content_techs = set()
 
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, repo_path)
+        def read_jobs() -> Iterator[Tuple[str, int, Callable[[str], Set[str]], Set[str]]]:
+            # Marker matching runs as the read-ahead pulls each entry
+            for entry, rel_path in entries:
+                filename = entry.name
 
-                found_techs = set()
-                for tech, patterns in self.tech_markers.items():
-                    for pattern in patterns:
-                        if re.search(pattern, filename, re.IGNORECASE) or re.search(pattern, rel_path, re.IGNORECASE):
-                            tech_occurrences[tech] = tech_occurrences.get(tech, 0) + 1
-                            found_techs.add(tech)
+                found_techs = self._filename_marker_techs(filename, rel_path)
+                tech_occurrences.update(found_techs)
 
-                file_extension = Path(filename).suffix.lower()
+                # Same rule as PurePath.suffix: a leading or trailing dot is not an extension
+                dot = filename.rfind('.')
+                file_extension = filename[dot:].lower() if 0 < dot < len(filename) - 1 else ''
                 if filename in self.file_content_analyzers or file_extension in self.file_content_analyzers:
                     analyzer = None
                     if filename in self.file_content_analyzers:
@@ -132,24 +449,15 @@ class TechnologyAnalyzer:
                         analyzer = self.file_content_analyzers.get(file_extension)
 
                     if analyzer:
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-                                additional_techs = analyzer(content)
-                                content_techs.update(additional_techs)
+                        max_chars = -1 if filename in self.file_content_analyzers else self._source_read_chars(entry)
+                        yield entry.path, max_chars, analyzer, found_techs
 
-                                for tech, patterns in self.content_signatures.items():
-                                    for pattern in patterns:
-                                        if re.search(pattern, content, re.IGNORECASE | re.MULTILINE):
-                                            tech_occurrences[tech] = tech_occurrences.get(tech, 0) + 1
-                                            found_techs.add(tech)
-                        except Exception:
-                            pass
+        # Files are read ahead on a thread pool while the regex work stays on this thread
+        for (_, _, analyzer, found_techs), read in read_ahead(read_jobs(), lambda job: _safe_read(*job[:2]),
+                                                               io_workers, _MAX_PENDING_READS):
+            self._analyze_read_file(analyzer, found_techs, read, tech_occurrences, content_techs)
 
-                total_files += 1
-
-        for tech in content_techs:
-            tech_occurrences[tech] = tech_occurrences.get(tech, 0) + 1
+        tech_occurrences.update(content_techs)
 
         tech_file_counts = {tech: count for tech, count in tech_occurrences.items() if count > 0}
         result["tech_file_counts"] = tech_file_counts
@@ -174,8 +482,85 @@ class TechnologyAnalyzer:
         diversity_score = min(1.0, len(detected_technologies) / 10)
         result["technology_diversity"] = diversity_score
 
+        self._cache = (repo_path, fingerprint, copy.deepcopy(result))
         return result
 
+    def _source_read_chars(self, entry: os.DirEntry) -> int:
+        try:
+            if entry.stat().st_size > _LARGE_SOURCE_BYTES:
+                return _LARGE_SOURCE_READ_CHARS
+        except OSError:
+            pass
+        return _SOURCE_READ_CHARS
+
+    def _filename_marker_techs(self, filename: str, rel_path: str) -> Set[str]:
+        techs = set()
+        if filename.isascii() and not filename.endswith("\n"):
+            dot = filename.rfind('.')
+            techs.update(_EXT_TO_TECHS.get(filename[dot:].lower() if dot != -1 else '', ()))
+            name_lower = filename.lower()
+            if name_lower.endswith(_SUFFIX_GATE):
+                techs.update(tech for suffix, tech in _SUFFIX_MARKERS if name_lower.endswith(suffix))
+        else:
+            # IGNORECASE also folds letters such as U+0131 onto ASCII, and $ matches before a final newline
+            techs.update(tech for pattern, tech in _LITERAL_MARKER_RES if pattern.search(filename))
+
+        # rel_path ends with filename, so one scan covers matches in either
+        if rel_path.isascii():
+            path_lower = rel_path.lower()
+            for tech, (literals, marker_re) in _ASCII_PATH_MARKERS.items():
+                if tech not in techs and (any(literal in path_lower for literal in literals)
+                                          or (marker_re is not None and marker_re.search(rel_path))):
+                    techs.add(tech)
+        else:
+            for tech, marker_re in _TECH_MARKER_RES.items():
+                if tech not in techs and marker_re.search(rel_path):
+                    techs.add(tech)
+
+        return techs
+
+    def _analyze_read_file(self, analyzer: Callable[[str], Set[str]], found_techs: Set[str], read: Future,
+                           tech_occurrences: Counter, content_techs: Set[str]) -> None:
+        try:
+            content = read.result()
+            if content is None:
+                return
+
+            additional_techs = analyzer(content)
+            content_techs.update(additional_techs)
+
+            if content.isascii():
+                # IGNORECASE on ASCII text is a plain lowercase comparison, so literals become substring tests
+                lowered = content.lower()
+                for tech, (literals, patterns) in _ASCII_CONTENT_SIGNATURES.items():
+                    if tech in found_techs:
+                        continue
+                    if (any(literal in lowered for literal in literals)
+                            or any(pattern.search(content) for pattern in patterns)):
+                        tech_occurrences[tech] += 1
+                        found_techs.add(tech)
+            else:
+                for tech, patterns in _COMPILED_CONTENT_SIGNATURES.items():
+                    if tech in found_techs:
+                        continue
+                    if any(pattern.search(content) for pattern in patterns):
+                        tech_occurrences[tech] += 1
+                        found_techs.add(tech)
+        except Exception:
+            pass
+
+    def _fingerprint(self, entries: List[Tuple[os.DirEntry, str]]) -> str:
+        # Any added, removed, resized or touched file changes the fingerprint
+        digest = hashlib.blake2b(digest_size=16)
+        for entry, _ in entries:
+            digest.update(os.fsencode(entry.path))
+            try:
+                stat = entry.stat()
+                digest.update(b"\0%d:%d\n" % (stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                digest.update(b"\0-\n")
+        return digest.hexdigest()
+
     def check_tech_requirements(self, detected_techs: List[str], required_techs: List[str],
                                 disallowed_techs: List[str]) -> Dict[str, Any]:
         result = {
@@ -210,31 +595,8 @@ class TechnologyAnalyzer:
     def _analyze_python_file(self, content: str) -> Set[str]:
         technologies = set()
 
-        import_patterns = [
-            (r"import\s+flask", "flask"),
-            (r"from\s+flask", "flask"),
-            (r"import\s+django", "django"),
-            (r"from\s+django", "django"),
-            (r"import\s+fastapi", "fastapi"),
-            (r"from\s+fastapi", "fastapi"),
-            (r"import\s+numpy", "numpy"),
-            (r"import\s+pandas", "pandas"),
-            (r"import\s+tensorflow", "tensorflow"),
-            (r"import\s+torch", "pytorch"),
-            (r"import\s+sklearn", "scikit-learn"),
-            (r"from\s+sklearn", "scikit-learn"),
-            (r"import\s+matplotlib", "matplotlib"),
-            (r"import\s+pymongo", "mongodb"),
-            (r"import\s+sqlalchemy", "sqlalchemy"),
-            (r"import\s+psycopg2", "postgresql"),
-            (r"import\s+mysql", "mysql"),
-            (r"import\s+boto3", "aws"),
-            (r"import\s+firebase_admin", "firebase"),
-            (r"import\s+keras", "keras"),
-        ]
-
-        for pattern, tech in import_patterns:
-            if re.search(pattern, content, re.MULTILINE):
+        for pattern, tech in _PYTHON_IMPORT_PATTERNS:
+            if pattern.search(content):
                 technologies.add(tech)
 
         return technologies
@@ -242,26 +604,8 @@ class TechnologyAnalyzer:
     def _analyze_js_file(self, content: str) -> Set[str]:
         technologies = set()
 
-        import_patterns = [
-            (r"import\s+.*\s+from\s+['\"]react", "react"),
-            (r"import\s+.*\s+from\s+['\"]vue", "vue"),
-            (r"import\s+.*\s+from\s+['\"]@angular", "angular"),
-            (r"import\s+.*\s+from\s+['\"]express", "express"),
-            (r"import\s+.*\s+from\s+['\"]mongoose", "mongodb"),
-            (r"import\s+.*\s+from\s+['\"]sequelize", "sql"),
-            (r"import\s+.*\s+from\s+['\"]pg\b", "postgresql"),
-            (r"import\s+.*\s+from\s+['\"]mysql", "mysql"),
-            (r"import\s+.*\s+from\s+['\"]firebase", "firebase"),
-            (r"import\s+.*\s+from\s+['\"]@aws-sdk", "aws"),
-            (r"import\s+.*\s+from\s+['\"]@azure", "azure"),
-            (r"import\s+.*\s+from\s+['\"]@google-cloud", "gcp"),
-            (r"import\s+.*\s+from\s+['\"]redux", "redux"),
-            (r"import\s+.*\s+from\s+['\"]@apollo/client", "graphql"),
-            (r"import\s+.*\s+from\s+['\"]axios", "axios"),
-        ]
-
-        for pattern, tech in import_patterns:
-            if re.search(pattern, content, re.MULTILINE):
+        for pattern, tech in _JS_IMPORT_PATTERNS:
+            if pattern.search(content):
                 technologies.add(tech)
 
         return technologies
@@ -269,23 +613,8 @@ class TechnologyAnalyzer:
     def _analyze_java_file(self, content: str) -> Set[str]:
         technologies = set()
 
-        import_patterns = [
-            (r"import\s+org\.springframework", "spring"),
-            (r"import\s+javax\.persistence", "jpa"),
-            (r"import\s+java\.sql", "jdbc"),
-            (r"import\s+com\.fasterxml\.jackson", "jackson"),
-            (r"import\s+org\.hibernate", "hibernate"),
-            (r"import\s+com\.google\.firebase", "firebase"),
-            (r"import\s+com\.amazonaws", "aws"),
-            (r"import\s+com\.azure", "azure"),
-            (r"import\s+com\.google\.cloud", "gcp"),
-            (r"import\s+io\.reactivex", "rxjava"),
-            (r"import\s+reactor\.core", "reactor"),
-            (r"import\s+org\.mongodb", "mongodb"),
-        ]
-
-        for pattern, tech in import_patterns:
-            if re.search(pattern, content, re.MULTILINE):
+        for pattern, tech in _JAVA_IMPORT_PATTERNS:
+            if pattern.search(content):
                 technologies.add(tech)
 
         return technologies
@@ -300,45 +629,18 @@ class TechnologyAnalyzer:
             dependencies.update(package_data.get("dependencies", {}))
             dependencies.update(package_data.get("devDependencies", {}))
 
-            dependency_map = {
-                "react": "react",
-                "react-dom": "react",
-                "vue": "vue",
-                "@vue/cli": "vue",
-                "@angular/core": "angular",
-                "express": "express",
-                "koa": "koa",
-                "next": "nextjs",
-                "nuxt": "nuxtjs",
-                "mongoose": "mongodb",
-                "sequelize": "sql",
-                "pg": "postgresql",
-                "mysql": "mysql",
-                "sqlite3": "sqlite",
-                "redis": "redis",
-                "firebase": "firebase",
-                "aws-sdk": "aws",
-                "@azure/core": "azure",
-                "@google-cloud/storage": "gcp",
-                "redux": "redux",
-                "apollo-client": "graphql",
-                "@apollo/client": "graphql",
-                "graphql": "graphql",
-                "tailwindcss": "tailwind",
-                "bootstrap": "bootstrap",
-                "jquery": "jquery",
-                "webpack": "webpack",
-                "jest": "jest",
-                "mocha": "mocha",
-                "cypress": "cypress",
-                "electron": "electron",
-                "typescript": "typescript"
-            }
-
             for dep in dependencies:
-                for known_dep, tech in dependency_map.items():
-                    if dep == known_dep or dep.startswith(f"{known_dep}/"):
+                tech = _PACKAGE_JSON_DEPENDENCIES.get(dep)
+                if tech:
+                    technologies.add(tech)
+
+                # A known package also matches the names nested under it, e.g. graphql/language
+                slash = dep.find("/")
+                while slash != -1:
+                    tech = _PACKAGE_JSON_DEPENDENCIES.get(dep[:slash])
+                    if tech:
                         technologies.add(tech)
+                    slash = dep.find("/", slash + 1)
         except Exception:
             pass
 
@@ -347,28 +649,6 @@ class TechnologyAnalyzer:
     def _analyze_requirements_txt(self, content: str) -> Set[str]:
         technologies = set()
 
-        dependency_map = {
-            "flask": "flask",
-            "django": "django",
-            "fastapi": "fastapi",
-            "numpy": "numpy",
-            "pandas": "pandas",
-            "tensorflow": "tensorflow",
-            "torch": "pytorch",
-            "scikit-learn": "scikit-learn",
-            "matplotlib": "matplotlib",
-            "pymongo": "mongodb",
-            "sqlalchemy": "sqlalchemy",
-            "psycopg2": "postgresql",
-            "mysqlclient": "mysql",
-            "boto3": "aws",
-            "firebase-admin": "firebase",
-            "google-cloud": "gcp",
-            "azure-": "azure",
-            "pytest": "pytest",
-            "jupyter": "jupyter",
-        }
-
         for line in content.split('\n'):
             line = line.strip().lower()
             if not line or line.startswith('#'):
@@ -376,7 +656,7 @@ class TechnologyAnalyzer:
 
             package = line.split('==')[0].split('>=')[0].split('<=')[0].strip()
 
-            for known_dep, tech in dependency_map.items():
+            for known_dep, tech in _known_dependencies(package, _REQUIREMENTS_DEPENDENCIES, _REQUIREMENTS_AUTOMATON):
                 if package == known_dep or package.startswith(f"{known_dep}-"):
                     technologies.add(tech)
 
@@ -385,28 +665,8 @@ class TechnologyAnalyzer:
     def _analyze_pyproject_toml(self, content: str) -> Set[str]:
         technologies = set()
 
-        dependency_patterns = [
-            (r"flask\s*=", "flask"),
-            (r"django\s*=", "django"),
-            (r"fastapi\s*=", "fastapi"),
-            (r"numpy\s*=", "numpy"),
-            (r"pandas\s*=", "pandas"),
-            (r"tensorflow\s*=", "tensorflow"),
-            (r"torch\s*=", "pytorch"),
-            (r"scikit-learn\s*=", "scikit-learn"),
-            (r"matplotlib\s*=", "matplotlib"),
-            (r"pymongo\s*=", "mongodb"),
-            (r"sqlalchemy\s*=", "sqlalchemy"),
-            (r"psycopg2\s*=", "postgresql"),
-            (r"mysqlclient\s*=", "mysql"),
-            (r"boto3\s*=", "aws"),
-            (r"firebase-admin\s*=", "firebase"),
-            (r"google-cloud\s*=", "gcp"),
-            (r"azure-\w+\s*=", "azure"),
-        ]
-
-        for pattern, tech in dependency_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern, tech in _PYPROJECT_DEPENDENCY_PATTERNS:
+            if pattern.search(content):
                 technologies.add(tech)
 
         return technologies
@@ -414,21 +674,8 @@ class TechnologyAnalyzer:
     def _analyze_pom_xml(self, content: str) -> Set[str]:
         technologies = set()
 
-        dependency_patterns = [
-            (r"<artifactId>spring-boot</artifactId>", "spring"),
-            (r"<artifactId>spring-webmvc</artifactId>", "spring"),
-            (r"<artifactId>hibernate-core</artifactId>", "hibernate"),
-            (r"<artifactId>mysql-connector-java</artifactId>", "mysql"),
-            (r"<artifactId>postgresql</artifactId>", "postgresql"),
-            (r"<artifactId>mongodb-driver</artifactId>", "mongodb"),
-            (r"<artifactId>aws-java-sdk</artifactId>", "aws"),
-            (r"<artifactId>azure-sdk</artifactId>", "azure"),
-            (r"<artifactId>google-cloud</artifactId>", "gcp"),
-            (r"<artifactId>firebase-admin</artifactId>", "firebase"),
-        ]
-
-        for pattern, tech in dependency_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern, tech in _POM_DEPENDENCY_PATTERNS:
+            if pattern.search(content):
                 technologies.add(tech)
 
         return technologies
@@ -436,20 +683,8 @@ class TechnologyAnalyzer:
     def _analyze_gradle_file(self, content: str) -> Set[str]:
         technologies = set()
 
-        dependency_patterns = [
-            (r"org\.springframework\.boot", "spring"),
-            (r"org\.hibernate", "hibernate"),
-            (r"mysql-connector-java", "mysql"),
-            (r"org\.postgresql", "postgresql"),
-            (r"org\.mongodb", "mongodb"),
-            (r"com\.amazonaws", "aws"),
-            (r"com\.azure", "azure"),
-            (r"com\.google\.cloud", "gcp"),
-            (r"com\.google\.firebase", "firebase"),
-        ]
-
-        for pattern, tech in dependency_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern, tech in _GRADLE_DEPENDENCY_PATTERNS:
+            if pattern.search(content):
                 technologies.add(tech)
 
         return technologies
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Text helpers shared by the content scanners in DevPost Validator.
+"""
+import mmap
+import re
+from bisect import bisect_left
+from typing import List, Sequence, Union
+
+_NEWLINE_PATTERN = re.compile("\n")
+
+# Every non-ASCII character that re's IGNORECASE matching folds onto an ASCII letter,
+# mapped to that letter. No other ASCII character matches anything beyond its own
+# upper and lower case, and str.lower() does not map these four onto ASCII.
+IGNORECASE_ASCII_FOLDS = {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+
+
+def decode_text(raw: Union[bytes, bytearray, memoryview, mmap.mmap]) -> str:
+    """
+    Decode file bytes the way open(path, encoding='utf-8', errors='ignore') reads them.
+    
+    Args:
+        raw: The file contents, as bytes or any buffer such as an mmap
+    
+    Returns:
+        The decoded text with universal newlines applied
+    """
+    text = str(raw, 'utf-8', 'ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def newline_offsets(text: str) -> List[int]:
+    """
+    Find the offset of every newline in a text.
+    
+    Args:
+        text: The text to index
+    
+    Returns:
+        Ascending list of newline offsets
+    """
+    return [match.start() for match in _NEWLINE_PATTERN.finditer(text)]
+
+
+def line_number(offsets: Sequence[int], position: int) -> int:
+    """
+    Get the 1-based line number of a position.
+    
+    Args:
+        offsets: Newline offsets from newline_offsets()
+        position: Offset into the indexed text
+    
+    Returns:
+        The line containing the position
+    """
+    return bisect_left(offsets, position) + 1
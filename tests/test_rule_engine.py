@@ -0,0 +1,82 @@
+import itertools
+import random
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from devpost_validator.rule_engine import RuleEngine
+
+
+# Every character IGNORECASE treats as the same letter, for the letters that fold beyond ASCII
+_FOLD_VARIANTS = {
+    "i": "iIİı",
+    "k": "kKK",
+    "s": "sSſ",
+}
+
+_PATTERNS = (
+    r"(?i)kelvin",
+    r"(?i)secret",
+    r"(?i)ai",
+    r"(?i)(?:skip|kit)",
+    r"(?i)x(?:yz)?k",
+    r"(?i)[a-k]s",
+    r"(?i)(?:foo|bar)+i",
+    r"token(?:s)?",
+    r"(?i:ski)|ß",
+    r"(?i)ß",
+)
+
+_SAMPLES = ("kelvin", "secret", "ai", "skip", "kit", "xk", "xyzk", "ks", "fooi", "bari", "tokens", "ski", "ß", "ẞ")
+
+
+def _fold_variants(text: str):
+    """Yield every spelling of ``text`` with the special-folding letters swapped for their variants."""
+    choices = [_FOLD_VARIANTS.get(char.lower(), char + char.swapcase()) for char in text]
+    for variant in itertools.product(*choices):
+        yield "".join(variant)
+
+
+class RequiredCharsPrefilterTest(unittest.TestCase):
+    def setUp(self):
+        home = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        with mock.patch.object(Path, "home", return_value=Path(home.name)):
+            self.engine = RuleEngine()
+
+    def _use_rule(self, pattern: str) -> None:
+        self.engine.rules = [{"name": "r", "pattern": pattern, "description": "", "severity": "low"}]
+        self.engine.custom_rules = []
+        self.engine._compile_rules()
+
+    def _assert_never_skipped(self, pattern: str, content: str) -> None:
+        if re.search(pattern, content, re.MULTILINE):
+            self.assertTrue(self.engine._may_match(content), f"{pattern!r} matches {content!r}")
+
+    def test_case_fold_variants_are_never_skipped(self):
+        for pattern in _PATTERNS:
+            self._use_rule(pattern)
+            for sample in _SAMPLES:
+                for content in _fold_variants(sample):
+                    self._assert_never_skipped(pattern, f"x = {content};")
+
+    def test_random_content_is_never_skipped(self):
+        rng = random.Random(0)
+        alphabet = "".join(_FOLD_VARIANTS.values()) + "abcelnoprtvxyzABXYZßẞ _=\n"
+        for pattern in _PATTERNS:
+            self._use_rule(pattern)
+            for _ in range(3000):
+                content = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+                self._assert_never_skipped(pattern, content)
+
+    def test_required_chars_include_special_folds(self):
+        self._use_rule(r"(?i)i")
+        self.assertTrue({"i", "I", "İ", "ı"} <= self.engine._required_chars)
+        self._use_rule(r"(?i)ß")
+        self.assertIsNone(self.engine._required_chars)
+
+
+if __name__ == "__main__":
+    unittest.main()
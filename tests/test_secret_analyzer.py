@@ -0,0 +1,97 @@
+import random
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from devpost_validator import secret_analyzer
+from devpost_validator.secret_analyzer import SecretAnalyzer
+
+
+# Characters that IGNORECASE folds onto ASCII letters, mixed into the random content
+_FOLDING_CHARS = "İıſK"
+_FILLER = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-=:'\" \n/." + _FOLDING_CHARS
+
+
+def _random_content(rng: random.Random) -> str:
+    """Build content from keywords with randomly cased or folded letters, separators and values."""
+    keywords = sorted(secret_analyzer._ALL_KEYWORDS)
+    parts = []
+    for _ in range(rng.randint(1, 6)):
+        keyword = rng.choice(keywords)
+        parts.append("".join(_random_case(rng, char) for char in keyword))
+        parts.append("".join(rng.choice(_FILLER) for _ in range(rng.randint(0, 48))))
+    return "".join(parts)
+
+
+def _random_case(rng: random.Random, char: str) -> str:
+    variants = {char, char.upper()}
+    variants.update(fold for fold in _FOLDING_CHARS if re.fullmatch(re.escape(char), fold, re.IGNORECASE))
+    return rng.choice(sorted(variants))
+
+
+class _AnalyzerTestCase(unittest.TestCase):
+    def setUp(self):
+        home = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        with mock.patch.object(Path, "home", return_value=Path(home.name)):
+            self.analyzer = SecretAnalyzer()
+
+    def _types(self, content: str):
+        return {finding["type"] for finding in self.analyzer._scan_for_secrets(content, "f")}
+
+
+class SecretKeywordGatingTest(_AnalyzerTestCase):
+
+    def test_present_keywords_matches_ignorecase_search(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            content = _random_content(rng)
+            expected = {
+                keyword for keyword in secret_analyzer._ALL_KEYWORDS
+                if re.search(re.escape(keyword), content, re.IGNORECASE)
+            }
+            self.assertEqual(secret_analyzer._present_keywords(content), expected, repr(content))
+
+    def test_gating_does_not_change_findings(self):
+        rng = random.Random(1)
+        for _ in range(2000):
+            content = _random_content(rng)
+            gated = self.analyzer._scan_for_secrets(content, "f")
+            with mock.patch.object(secret_analyzer, "_present_keywords",
+                                   return_value=secret_analyzer._ALL_KEYWORDS):
+                ungated = self.analyzer._scan_for_secrets(content, "f")
+            self.assertEqual(gated, ungated, repr(content))
+
+    def test_dotted_capital_i_keyword(self):
+        findings = self.analyzer._scan_for_secrets("x = gİthub_token_" + "a" * 36, "f")
+        self.assertIn("GitHub Token", {finding["type"] for finding in findings})
+
+    def test_custom_pattern_is_scanned(self):
+        self.analyzer.secret_patterns.append((r"MYCO-[0-9]{8}", "Custom Token", "high"))
+        findings = self.analyzer._scan_for_secrets("x = 'MYCO-12345678'", "f")
+        self.assertEqual([finding["type"] for finding in findings], ["Custom Token"])
+
+
+
+class GenericKeyPatternTest(_AnalyzerTestCase):
+    VALUE = "a1b2c3d4e5" * 3 + "f6g7"
+
+    def test_keyword_spellings_are_detected(self):
+        for line in ('const apiKey = "%s"', '"apiKey": "%s"', "secretKey: %s", 'API_KEY = "%s"',
+                     "STRIPEKEY=%s", 'accessToken="%s"'):
+            with self.subTest(line=line):
+                self.assertIn("Potential API Key/Token", self._types(line % self.VALUE))
+
+    def test_keyword_inside_a_lowercase_word_is_ignored(self):
+        for line in ("monkey = %s", "hotkey=%s", "turkey: %s"):
+            with self.subTest(line=line):
+                self.assertNotIn("Potential API Key/Token", self._types(line % self.VALUE))
+
+    def test_match_does_not_cross_lines(self):
+        self.assertNotIn("Potential API Key/Token", self._types("key\n\n=\n" + self.VALUE))
+
+
+if __name__ == "__main__":
+    unittest.main()